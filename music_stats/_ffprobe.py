@@ -0,0 +1,14 @@
+import subprocess
+
+
+def probe_duration(path):
+    """Return the duration of a media file in seconds, as reported by ffprobe."""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", path],
+        capture_output=True, text=True, check=True)
+    return float(result.stdout.strip())
+
+
+def run_ffmpeg(args):
+    """Run ffmpeg quietly with the given arguments, overwriting existing outputs. Raises CalledProcessError on failure."""
+    subprocess.run(["ffmpeg", *args, "-y"], capture_output=True, check=True)
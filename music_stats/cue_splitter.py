@@ -1,5 +1,25 @@
-import os, sys
-import ffmpeg
+import functools, os, re, sys
+from subprocess import CalledProcessError
+from concurrent.futures import ProcessPoolExecutor
+
+if __package__:
+    from ._ffprobe import probe_duration, run_ffmpeg
+else:  # Run as a script from the package directory
+    from _ffprobe import probe_duration, run_ffmpeg
+
+# Characters not allowed in generated track file names (\w covers Unicode letters and digits)
+_UNSAFE_RE = re.compile(r'[^\w .\-]')
+
+@functools.lru_cache(maxsize=1024)
+def _probe_duration(path, mtime_ns):
+    """Run ffprobe on a file. mtime_ns is only part of the cache key, so edited files are probed again."""
+    return probe_duration(path)
+
+
+def probe_file_duration(path):
+    """Return the duration of a file from ffprobe, reusing earlier results while the file is unchanged."""
+    return _probe_duration(path, os.stat(path).st_mtime_ns)
+
 
 def parse_cue(cue_path):
     """Parse a .cue file and return album metadata and track list with details."""
@@ -23,11 +43,13 @@ def parse_cue(cue_path):
             s = s[1:-1]
         return s
 
-    with open(cue_path, 'r', encoding='utf-8', errors='ignore') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith(';'):
-                continue  # skip empty lines or comments
+    with open(cue_path, 'rb') as f:
+        for raw in f.read().splitlines():
+            # Skip empty lines and comments on the raw bytes, before paying for a decode
+            stripped = raw.lstrip()
+            if not stripped or stripped[:1] == b';':
+                continue
+            line = stripped.rstrip().decode('utf-8', errors='ignore')
             # Split the line into command and rest (at the first whitespace)
             parts = line.split(maxsplit=1)
             cmd = parts[0].upper()
@@ -173,47 +195,50 @@ def parse_cue(cue_path):
     return album_info
 
 
+def parse_cue_batch(cue_paths, workers=None):
+    """Parse many .cue files in parallel and return their album_info dicts in input order."""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Cue files are tiny, so hand them out in chunks to keep IPC overhead down
+        return list(executor.map(parse_cue, cue_paths, chunksize=16))
+
+
 def extract_tracks(album_info, output_dir):
     """Use ffmpeg to extract tracks according to the parsed album_info."""
     tracks = album_info["tracks"]
     if not tracks:
         return  # No tracks to process
 
+    output_dir = os.fspath(os.path.normpath(output_dir))
     os.makedirs(output_dir, exist_ok=True)
     total_tracks = len(tracks)
+    # Output files keep the source extension (e.g., .flac, .wav); cues usually reference one file
+    file_extensions = {}
+    # Gapless tracks grouped by source file: {file: [(track_num, output_path, output_args)]}
+    gapless_outputs = {}
 
-    # Determine audio properties (sample rate, channels) for silence generation
-    # We'll use ffprobe via ffmpeg.probe to get stream info from the first track's file.
-    sample_rate = None
-    channels = None
-    first_file = tracks[0]["file"]
-    try:
-        # Use ffmpeg.probe to get audio stream info (requires ffprobe/ffmpeg installed)
-        probe = ffmpeg.probe(first_file)
-        for stream in probe.get('streams', []):
-            if stream.get('codec_type') == 'audio':
-                sample_rate = int(stream.get('sample_rate', 0)) or None
-                channels = int(stream.get('channels', 0)) or None
-                break
-    except ffmpeg.Error:
-        pass  # If probing fails, we'll fall back to defaults
-
-    # Default to common values if not found
-    if sample_rate is None:
-        sample_rate = 44100
-    if channels is None:
-        channels = 2
+    # Album-level metadata is identical for every track, so resolve it once
+    album = album_info.get("album") or ""
+    album_artist_default = album_info.get("album_artist") or ""
+    year = album_info.get("year") or ""
+    genre = album_info.get("genre") or ""
+    comment = album_info.get("comment") or ""
+    disc_id = album_info.get("disc_id") or ""
+    # Combine comment and DiscID if both present
+    comment_text = comment
+    if disc_id:
+        # If there's an existing comment, append DiscID; otherwise, use DiscID as comment
+        if comment_text:
+            comment_text = f"{comment_text} | DiscID: {disc_id}"
+        else:
+            comment_text = f"DiscID: {disc_id}"
+    # Zero-pad track number to at least 2 digits (if total tracks >= 10)
+    num_width = 2 if total_tracks >= 10 else 1
 
     for track in tracks:
         track_num = track["number"]
         title = track.get("title") or f"Track {track_num}"
-        artist = track.get("artist") or album_info.get("album_artist") or ""
-        album = album_info.get("album") or ""
-        album_artist = album_info.get("album_artist") or artist  # if album artist missing, use track artist
-        year = album_info.get("year") or ""
-        genre = album_info.get("genre") or ""
-        comment = album_info.get("comment") or ""
-        disc_id = album_info.get("disc_id") or ""
+        artist = track.get("artist") or album_artist_default
+        album_artist = album_artist_default or artist  # if album artist missing, use track artist
 
         # Calculate start and end times for the track's audio segment within its file
         start_time = track["index1"] if track["index1"] is not None else 0.0
@@ -232,26 +257,6 @@ def extract_tracks(album_info, output_dir):
                 else:
                     end_time = nxt["index1"]
                 break
-        # If not found, this track is last in its file; we'll use file's duration as end.
-        if end_time is None:
-            # Probe duration of the file or leave None to let ffmpeg read till end
-            try:
-                if "duration" in locals():  # use cached probe if available (not implemented here for each track)
-                    file_duration = float(probe.get('format', {}).get('duration'))
-                else:
-                    file_duration = float(ffmpeg.probe(track["file"])['format']['duration'])
-            except Exception:
-                file_duration = None
-            end_time = file_duration
-
-        # Compute duration for ffmpeg (if end_time known)
-        duration = None
-        if end_time is not None:
-            # Ensure end_time is after start_time
-            if end_time < start_time:
-                end_time = start_time
-            duration = end_time - start_time
-
         # Determine pregap and postgap durations to add (if any)
         pregap_duration = 0.0
         postgap_duration = 0.0
@@ -266,82 +271,96 @@ def extract_tracks(album_info, output_dir):
             postgap_duration = track["postgap"]
         # (No need to handle index of next track as postgap here, since we assigned end_time accordingly)
 
-        # Prepare ffmpeg input streams
-        main_audio = ffmpeg.input(track["file"], ss=start_time, t=duration)  # main audio segment
-        audio_stream = main_audio.audio  # get the audio stream (for files that might have video, though unlikely here)
-        segments = []
-        # Pregap: generate silence segment if needed
-        if pregap_duration > 0:
-            silence = ffmpeg.input(
-                'anullsrc=r={}:cl={}'.format(sample_rate, "stereo" if channels == 2 else f"{channels}c"),
-                format='lavfi',
-                duration=pregap_duration
-            )
-            segments.append(silence.audio)
-        # Main audio segment
-        segments.append(audio_stream)
-        # Postgap: generate silence segment if needed
-        if postgap_duration > 0:
-            silence2 = ffmpeg.input(
-                'anullsrc=r={}:cl={}'.format(sample_rate, "stereo" if channels == 2 else f"{channels}c"),
-                format='lavfi',
-                duration=postgap_duration
-            )
-            segments.append(silence2.audio)
-
-        # Concatenate segments if there are multiple, otherwise use single segment
-        if len(segments) > 1:
-            # Use ffmpeg concat filter to join audio segments&#8203;:contentReference[oaicite:13]{index=13}
-            concat_audio = ffmpeg.concat(*segments, v=0, a=1)
-            output_stream = concat_audio
-        else:
-            output_stream = segments[0]
+        # If not found, this track is last in its file and ends with it. A gapless track is left without
+        # a duration so ffmpeg reads till the end, which saves an ffprobe launch; the gap filters need
+        # an explicit length, so for those the file's duration is probed.
+        if end_time is None and (pregap_duration > 0 or postgap_duration > 0):
+            # Probe duration of the file or leave None to let ffmpeg read till end
+            try:
+                file_duration = probe_file_duration(track["file"])
+            except Exception:
+                file_duration = None
+            end_time = file_duration
+
+        # Compute duration for ffmpeg (if end_time known)
+        duration = None
+        if end_time is not None:
+            # Ensure end_time is after start_time
+            if end_time < start_time:
+                end_time = start_time
+            duration = end_time - start_time
 
         # Construct output file name
-        # Zero-pad track number to at least 2 digits (if total tracks >= 10)
-        num_width = 2 if total_tracks >= 10 else 1
         track_num_str = str(track_num).zfill(num_width)
         # Make a safe file name component from title
-        safe_title = "".join(c if c.isalnum() or c in " _-." else "_" for c in title)
-        ext = os.path.splitext(track["file"])[1]  # use original file extension (e.g., .flac, .wav)
+        safe_title = _UNSAFE_RE.sub("_", title)
+        ext = file_extensions.get(track["file"])
+        if ext is None:
+            ext = file_extensions[track["file"]] = os.path.splitext(track["file"])[1]
         output_filename = f"{track_num_str} - {safe_title}{ext}"
         output_path = os.path.join(output_dir, output_filename)
 
-        # Prepare metadata for ffmpeg output
-        metadata_kwargs = {
-            # Using ffmpeg metadata keys (lowercase)&#8203;:contentReference[oaicite:14]{index=14}&#8203;:contentReference[oaicite:15]{index=15}
-            "metadata": f"title={title}",
-            "metadata:g:0": f"artist={artist}",
-            "metadata:g:1": f"album={album}",
-            "metadata:g:2": f"album_artist={album_artist}",
-            "metadata:g:3": f"track={track_num}/{total_tracks}",
-        }
-        if year := album_info.get("year"):
-            metadata_kwargs["metadata:g:4"] = f"date={year}"
-        if genre := album_info.get("genre"):
-            metadata_kwargs["metadata:g:5"] = f"genre={genre}"
-        # Combine comment and DiscID if both present
-        comment_text = comment
-        if disc_id:
-            # If there's an existing comment, append DiscID; otherwise, use DiscID as comment
-            if comment_text:
-                comment_text = f"{comment_text} | DiscID: {disc_id}"
-            else:
-                comment_text = f"DiscID: {disc_id}"
+        # Prepare metadata for ffmpeg output as (key, value) pairs
+        metadata = [
+            ("title", title),
+            ("artist", artist),
+            ("album", album),
+            ("album_artist", album_artist),
+            ("track", f"{track_num}/{total_tracks}"),
+        ]
+        if year:
+            metadata.append(("date", year))
+        if genre:
+            metadata.append(("genre", genre))
         if comment_text:
-            metadata_kwargs["metadata:g:6"] = f"comment={comment_text}"
+            metadata.append(("comment", comment_text))
+        metadata_args = []
+        for key, value in metadata:
+            metadata_args += ["-metadata", f"{key}={value}"]
+
+        if pregap_duration <= 0 and postgap_duration <= 0:
+            # Gapless tracks are cut from their source file together after the loop
+            output_args = ["-map", "0:a", *metadata_args, "-ss", str(start_time)]
+            if duration is not None:
+                output_args += ["-t", str(duration)]
+            gapless_outputs.setdefault(track["file"], []).append((track_num, output_path, output_args))
+            continue
+
+        # Tracks with gaps get their own pipeline. Gaps are rendered on the single input stream
+        # (adelay for pregap, apad for postgap) rather than concatenating generated silence.
+        input_args = ["-ss", str(start_time)]
+        if duration is not None:
+            input_args += ["-t", str(duration)]
+        filters = []
+        if pregap_duration > 0:
+            filters.append(f"adelay=all=1:delays={int(pregap_duration * 1000)}")
+        if postgap_duration > 0:
+            filters.append(f"apad=pad_dur={postgap_duration}")
+        if duration is not None:
+            filters.append(f"atrim=duration={duration + pregap_duration + postgap_duration}")
+            filters.append("asetpts=N/SR/TB")
 
         # Set up the output with metadata and run ffmpeg
         try:
-            (output_stream
-             .output(output_path, **metadata_kwargs)
-             .overwrite_output()  # overwrite if file exists
-             .run(quiet=True)  # run FFmpeg
-             )
-        except ffmpeg.Error as e:
+            run_ffmpeg([*input_args, "-i", track["file"],
+                        "-filter_complex", f"[0:a]{','.join(filters)}[out]", "-map", "[out]",
+                        *metadata_args, output_path])
+        except (OSError, CalledProcessError) as e:
             raise RuntimeError(f"FFmpeg failed to process track {track_num}: {e}")
     # End of track loop
 
+    # Split all gapless tracks of a source file with one ffmpeg process: the input is
+    # decoded once and every track is written as its own output (-map 0:a -ss -t per output).
+    for source_file, outputs in gapless_outputs.items():
+        args = ["-i", source_file]
+        for _, output_path, output_args in outputs:
+            args += [*output_args, output_path]
+        try:
+            run_ffmpeg(args)
+        except (OSError, CalledProcessError) as e:
+            track_nums = ", ".join(str(track_num) for track_num, _, _ in outputs)
+            raise RuntimeError(f"FFmpeg failed to process tracks {track_nums}: {e}")
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python cue_split.py <path/to/file.cue>")
@@ -0,0 +1,301 @@
+import mmap
+import os
+import struct
+
+# Tags read by music_stats, keyed like mutagen's easy interface
+_ID3_FRAMES = {
+    b"TPE1": "artist",
+    b"TPE2": "albumartist",
+    b"TALB": "album",
+    b"TPOS": "discnumber",
+}
+_ID3V22_FRAMES = {
+    b"TP1": "artist",
+    b"TP2": "albumartist",
+    b"TAL": "album",
+    b"TPA": "discnumber",
+}
+_VORBIS_KEYS = frozenset({"artist", "albumartist", "album", "discnumber", "disc"})
+
+_ID3_ENCODINGS = ("latin-1", "utf-16", "utf-16-be", "utf-8")
+
+# Precompiled, so the frame loop doesn't parse the format string per frame
+_ID3_FRAME_HEADER = struct.Struct("!4sIH")
+_LE_UINT32 = struct.Struct("<I")
+
+_FLAC_STREAMINFO = 0
+_FLAC_VORBIS_COMMENT = 4
+
+
+class UnsupportedTag(Exception):
+    """The file uses a layout the fast parser doesn't handle; mutagen has to parse it."""
+
+
+def _syncsafe(data, offset):
+    """
+    Decode a 4-byte syncsafe integer (7 bits per byte).
+
+    :param data: Buffer holding the integer.
+    :param offset: Offset of the integer in the buffer.
+    :return: Decoded integer.
+    """
+    b0, b1, b2, b3 = data[offset:offset + 4]
+    if (b0 | b1 | b2 | b3) & 0x80:
+        raise UnsupportedTag("Invalid syncsafe integer")
+    return (b0 << 21) | (b1 << 14) | (b2 << 7) | b3
+
+
+def _decode_text_frame(data):
+    """
+    Decode the body of an ID3 text frame the way mutagen does (values separated by NUL).
+
+    :param data: Frame body, starting with the encoding byte.
+    :return: List of values.
+    """
+    if not data:
+        return []
+    encoding = data[0]
+    if encoding >= len(_ID3_ENCODINGS):
+        raise UnsupportedTag("Unknown text encoding")
+    text = data[1:].decode(_ID3_ENCODINGS[encoding]).replace("\ufeff", "")
+    return text.rstrip("\x00").split("\x00")
+
+
+def read_id3v2(buf):
+    """
+    Read the tags music_stats needs from an ID3v2 tag at the start of a file.
+
+    :param buf: Buffer (e.g. an mmap) of the whole file.
+    :return: Tuple (tags, audio_offset): mutagen-style dictionary of tag -> list of values,
+             and the offset of the first byte after the tag.
+    """
+    if len(buf) < 10 or buf[:3] != b"ID3":
+        raise UnsupportedTag("No ID3v2 header")
+    version = buf[3]
+    flags = buf[5]
+    if version not in (2, 3, 4):
+        raise UnsupportedTag("Unknown ID3v2 version")
+    # Unsynchronised tags and extended headers are rare; leave them to mutagen
+    if flags & 0xC0:
+        raise UnsupportedTag("Unsynchronised tag or extended header")
+
+    end = 10 + _syncsafe(buf, 6)
+    audio_offset = end + 10 if version == 4 and flags & 0x10 else end  # Footer
+    if end > len(buf):
+        raise UnsupportedTag("Truncated tag")
+
+    tags = {}
+    offset = 10
+    # Stop at the end of the tag, or as soon as all the wanted frames have been seen
+    if version == 2:
+        while offset + 6 <= end and len(tags) < len(_ID3V22_FRAMES):
+            frame_id = bytes(buf[offset:offset + 3])
+            if frame_id[0] == 0:  # Padding
+                break
+            size = int.from_bytes(buf[offset + 3:offset + 6], "big")
+            offset += 6
+            key = _ID3V22_FRAMES.get(frame_id)
+            if key is not None and key not in tags:
+                tags[key] = _decode_text_frame(buf[offset:offset + size])
+            offset += size
+    else:
+        unpack_header = _ID3_FRAME_HEADER.unpack_from
+        while offset + 10 <= end and len(tags) < len(_ID3_FRAMES):
+            frame_id, size, frame_flags = unpack_header(buf, offset)
+            if frame_id[0] == 0:  # Padding
+                break
+            if version == 4:
+                size = _syncsafe(buf, offset + 4)
+            offset += 10
+            key = _ID3_FRAMES.get(frame_id)
+            if key is not None and key not in tags:
+                # Compressed, encrypted or per-frame unsynchronised frames need mutagen
+                if frame_flags & (0x00CF if version == 4 else 0x00E0):
+                    raise UnsupportedTag("Unsupported frame flags")
+                tags[key] = _decode_text_frame(buf[offset:offset + size])
+            offset += size
+
+    return tags, audio_offset
+
+
+def _has_mpeg_sync(buf, offset):
+    """
+    Check that an MPEG audio frame starts at the given offset, so that files with a valid tag
+    but no audio are still left to mutagen (which reports them as corrupt).
+
+    :param buf: Buffer of the whole file.
+    :param offset: Offset to check.
+    :return: True if a frame sync is present.
+    """
+    return len(buf) >= offset + 4 and buf[offset] == 0xFF and buf[offset + 1] & 0xE0 == 0xE0
+
+
+def read_flac(buf):
+    """
+    Read the tags and the duration of a FLAC file by walking its metadata blocks.
+
+    :param buf: Buffer (e.g. an mmap) of the whole file.
+    :return: Tuple (tags, length, tagged): mutagen-style dictionary of tag -> list of values, the duration
+             in seconds, and whether the file has a Vorbis comment with any entries (wanted or not).
+    """
+    if buf[:4] != b"fLaC":
+        raise UnsupportedTag("No FLAC header")
+
+    tags = {}
+    length = None
+    tagged = False
+    offset = 4
+    last = False
+    while not last:
+        if offset + 4 > len(buf):
+            raise UnsupportedTag("Truncated metadata block")
+        header = buf[offset]
+        last = bool(header & 0x80)
+        block_type = header & 0x7F
+        size = int.from_bytes(buf[offset + 1:offset + 4], "big")
+        offset += 4
+        if offset + size > len(buf):
+            raise UnsupportedTag("Truncated metadata block")
+
+        if block_type == _FLAC_STREAMINFO:
+            if size < 18:
+                raise UnsupportedTag("Short STREAMINFO")
+            # 20 bits of sample rate, then 3 bits channels, 5 bits depth and 36 bits of total samples
+            sample_rate = (buf[offset + 10] << 12) | (buf[offset + 11] << 4) | (buf[offset + 12] >> 4)
+            if not sample_rate:
+                raise UnsupportedTag("Invalid sample rate")
+            total_samples = ((buf[offset + 13] & 0x0F) << 32) | int.from_bytes(buf[offset + 14:offset + 18], "big")
+            length = total_samples / float(sample_rate)
+        elif block_type == _FLAC_VORBIS_COMMENT:
+            tagged = _read_vorbis_comment(buf, offset, offset + size, tags) > 0 or tagged
+        offset += size
+
+    if length is None:
+        raise UnsupportedTag("Missing STREAMINFO")
+    return tags, length, tagged
+
+
+def _read_vorbis_comment(buf, offset, end, tags):
+    """
+    Collect the wanted fields of a Vorbis comment block.
+
+    :param buf: Buffer of the whole file.
+    :param offset: Offset of the block body.
+    :param end: Offset of the end of the block.
+    :param tags: Dictionary of tag -> list of values to fill.
+    :return: Number of comments in the block, including the ones that aren't wanted.
+    """
+    unpack_uint32 = _LE_UINT32.unpack_from
+    vendor_length, = unpack_uint32(buf, offset)
+    offset += 4 + vendor_length
+    count, = unpack_uint32(buf, offset)
+    offset += 4
+    for _ in range(count):
+        comment_length, = unpack_uint32(buf, offset)
+        offset += 4
+        if offset + comment_length > end:
+            raise UnsupportedTag("Truncated comment")
+        comment = bytes(buf[offset:offset + comment_length])
+        offset += comment_length
+        key, sep, value = comment.partition(b"=")
+        if not sep:
+            continue
+        key = key.decode("ascii").lower()
+        if key in _VORBIS_KEYS:
+            tags.setdefault(key, []).append(value.decode("utf-8"))
+    return count
+
+
+def read_mp3(buf):
+    """
+    Read the tags of an MP3 file from its ID3v2 tag. The duration is left to mutagen.
+
+    :param buf: Buffer (e.g. an mmap) of the whole file.
+    :return: Tuple (tags, None, tagged) with a mutagen-style dictionary of tag -> list of values.
+    """
+    tags, audio_offset = read_id3v2(buf)
+    if not _has_mpeg_sync(buf, audio_offset):
+        raise UnsupportedTag("No MPEG frame after the tag")
+    return tags, None, bool(tags)
+
+
+# Parser per (lowercase, dotless) file extension, so most files are dispatched without a probing read
+_EXT_PARSER = {
+    "mp3": read_mp3,
+    "flac": read_flac,
+}
+# Parser per leading magic bytes, for files with an unknown or missing extension
+_MAGIC_PARSER = (
+    (b"fLaC", read_flac),
+    (b"ID3", read_mp3),
+)
+_MAGIC_LENGTH = 16
+_HEADER_READAHEAD = 64 << 10  # Tags of typical files fit in the first 64 KiB
+
+
+def _fadvise(fd, offset, length, advice):
+    """
+    Pass an access pattern hint to the kernel, where posix_fadvise is available.
+    Hints are best effort, so errors (e.g. on filesystems that don't support them) are ignored.
+
+    :param fd: File descriptor.
+    :param offset: Start of the range.
+    :param length: Length of the range, 0 meaning up to the end of the file.
+    :param advice: One of the os.POSIX_FADV_* constants.
+    """
+    try:
+        os.posix_fadvise(fd, offset, length, advice)
+    except OSError:
+        pass
+
+
+def drop_cached_pages(fd):
+    """
+    Tell the kernel the pages read from a file won't be needed again, so a scan of a large library
+    doesn't push the rest of the page cache out. Call it once the file has been fully parsed.
+
+    :param fd: File descriptor of the file.
+    """
+    if hasattr(os, "posix_fadvise"):
+        _fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _magic_dispatch(fd):
+    """
+    Pick a parser from the first bytes of a file.
+
+    :param fd: File descriptor of the file.
+    :return: Parser function, or None if the format isn't handled here.
+    """
+    header = os.pread(fd, _MAGIC_LENGTH, 0)
+    for magic, parser in _MAGIC_PARSER:
+        if header.startswith(magic):
+            return parser
+    return None
+
+
+def read_tags(f, ext=None):
+    """
+    Read the tags of a common MP3 (ID3v2) or FLAC file straight from its headers, without mutagen.
+    The file is memory mapped, so only the pages holding the tags are read, and frames or blocks
+    that aren't needed (such as embedded cover art) are skipped over.
+
+    :param f: File object opened in binary mode.
+    :param ext: Lowercase file extension without the dot, used to pick the parser. If it isn't
+                a known one, the parser is picked from the magic bytes at the start of the file.
+    :return: Tuple (tags, length, tagged) with a mutagen-style dictionary of tag -> list of values, the duration
+             in seconds (None if it isn't cheaply available) and whether the file has any tags at all (which
+             mutagen needs before it reports a duration), or None if mutagen has to parse the file.
+    """
+    try:
+        fd = f.fileno()
+        if hasattr(os, "posix_fadvise"):
+            # Start reading the header in one go instead of page fault by page fault
+            _fadvise(fd, 0, _HEADER_READAHEAD, os.POSIX_FADV_WILLNEED)
+        parser = _EXT_PARSER.get(ext) or _magic_dispatch(fd)
+        if parser is None:
+            return None
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as buf:
+            return parser(buf)
+    except (UnsupportedTag, ValueError, OSError, struct.error, UnicodeDecodeError):
+        return None
@@ -2,85 +2,145 @@
 import argparse
 from mutagen import File
 import re
-import zlib
+import mmap
 from typing import List
 import os
 import sys
 import time
 import multiprocessing
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import sqlite3
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from tqdm import tqdm
 from dataclasses import dataclass, field
-from collections import defaultdict
-
-@dataclass
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import chain, combinations, repeat
+from operator import itemgetter
+
+try:
+    # ISA-L's crc32 uses PCLMULQDQ folding and is a drop-in replacement for zlib.crc32
+    from isal.isal_zlib import crc32
+except ImportError:
+    from zlib import crc32
+
+try:
+    # XXH3 runs several times faster than CRC32 and its 64-bit output makes accidental collisions negligible
+    from xxhash import xxh3_64_intdigest
+except ImportError:
+    xxh3_64_intdigest = None
+
+try:
+    # orjson encodes and decodes the --cache manifest rows several times faster than the json module.
+    # Its output is bytes, which sqlite stores as a BLOB; both loads() accept either form.
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    from json import dumps as json_dumps, loads as json_loads
+
+if __package__:
+    from .fast_tags import drop_cached_pages, read_tags
+else:  # Run as a script from the package directory
+    from fast_tags import drop_cached_pages, read_tags
+
+# Precompiled patterns for the per-file metadata helpers
+_DISC_RE = re.compile(r"(\d+)\s*(?:[/\-of]\s*(\d+))?", re.IGNORECASE)  # '1/2', '1-2', '1 of 2'
+_BRACKET_RE = re.compile(r'(\[.*?\]|\(.*?\)|\{.*?\})')  # Bracketed substrings
+_WS_SPLIT_RE = re.compile(r'(\s+)')  # Whitespace runs, kept as delimiters
+_SEP_RE = re.compile(r'([-/])')  # Dashes and slashes, kept as delimiters
+_SEP_SET = frozenset('-/')
+_DISC_INFO_RE = re.compile(r"\(Disc (\d+)\)", re.IGNORECASE)
+_DISC_STRIP_RE = re.compile(r"\s*\(Disc \d+\)")
+_MOUNT_ESCAPE_RE = re.compile(r'\\([0-7]{3})')  # Octal escapes in /proc/mounts fields
+
+@dataclass(slots=True)
 class Track:
     file_path: str
     artist: str
     album_artist: str
     album: str
     file_size: int
-    crc: int
+    content_hash: int
+
+def _hash_contents(data):
+    """
+    Hash file contents with XXH3-64 if xxhash is installed, CRC32 otherwise.
+
+    :param data: Bytes-like object (e.g. an mmap) to hash.
+    :return: Hash as an unsigned integer.
+    """
+    if xxh3_64_intdigest is not None:
+        return xxh3_64_intdigest(data)
+    return crc32(data) & 0xFFFFFFFF  # Ensure unsigned 32-bit integer
+
+def _hash_open_file(f):
+    """
+    Hash the contents of an open binary file through a read-only mmap.
+
+    :param f: File object opened in binary mode.
+    :return: Hash as an unsigned integer.
+    """
+    if os.fstat(f.fileno()).st_size == 0:
+        return _hash_contents(b"")  # Empty files cannot be memory-mapped
+    # Hash the whole mapped file in one call instead of looping over chunks in Python
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return _hash_contents(mapped)
 
-def compute_crc32(file_path):
+def compute_content_hash(file_path):
     """
-    Compute the 32-bit CRC of a file.
+    Compute the content hash of a file used to detect duplicate tracks.
 
     :param file_path: Path to the file.
-    :return: 32-bit CRC as an integer, or None if computation fails.
+    :return: Hash as an integer, or None if computation fails.
     """
-    buf_size = 65536  # Read in chunks of 64KB
-    crc = 0
     try:
         with open(file_path, 'rb') as f:
-            while True:
-                data = f.read(buf_size)
-                if not data:
-                    break
-                crc = zlib.crc32(data, crc)
-        return crc & 0xFFFFFFFF  # Ensure unsigned 32-bit integer
+            return _hash_open_file(f)
     except Exception as e:
-        print(f"Error computing CRC for {file_path}: {e}", file=sys.stderr)
+        print(f"Error hashing {file_path}: {e}", file=sys.stderr)
         return None
 
-def get_duration(file_path):
+def _compute_content_hash_with_path(file_path):
     """
-    Get the duration of an audio file in seconds.
+    Process pool worker for compute_content_hash_batch.
 
-    :param file_path: Path to the audio file.
-    :return: Duration in seconds, or None if retrieval fails.
+    :param file_path: Path to the file.
+    :return: Tuple (file_path, content_hash).
     """
-    try:
-        audio = File(file_path)
-        if audio and audio.info:
-            return audio.info.length  # Duration in seconds
-    except Exception as e:
-        print(f"Error retrieving duration for {file_path}: {e}")
-    return None  # Return None if extraction fails
+    return file_path, compute_content_hash(file_path)
 
-def get_file_size(file_path):
+def compute_content_hash_batch(file_paths, show_progress=False):
     """
-    Get the file size in bytes.
+    Compute the content hash of many files in parallel, one process per core.
 
-    :param file_path: Path to the file.
-    :return: File size in bytes.
+    :param file_paths: List of file paths.
+    :param show_progress: Display a tqdm bar while hashing.
+    :return: List of (file_path, content_hash) tuples in input order.
     """
-    return os.path.getsize(file_path)
-
-def truncate_file_name(file_name, max_length=30):
+    if not file_paths:
+        return []
+    workers = os.cpu_count() or 1
+    chunk_size = max(1, len(file_paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_compute_content_hash_with_path, file_paths, chunksize=chunk_size)
+        # Redraw at most every 0.2s, and only check the clock every 256 files
+        return list(tqdm(results, total=len(file_paths), unit="file", disable=not show_progress,
+                         mininterval=0.2, miniters=256, smoothing=0))
+
+# Memo for get_metadata in the parent process (the interactive fix prompts), so a file is only
+# tag-parsed once there. Entries are dropped by invalidate_file_cache() whenever the tags of a file are rewritten.
+_METADATA_CACHE = {}
+
+def invalidate_file_cache(file_path):
     """
-    Truncate a string to a fixed length and append '...' if needed.
+    Drop cached metadata for a file after it has been modified.
 
-    :param file_name: The original file name.
-    :param max_length: Maximum allowed length.
-    :return: Truncated file name.
+    :param file_path: Path to the file.
     """
-    if len(file_name) > max_length:
-        return file_name[:max_length - 3] + '...'
-    return file_name
+    _METADATA_CACHE.pop(file_path, None)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Metadata:
     artist: str | None
     album_artist: str | None
@@ -104,7 +164,7 @@ def extract_disc_number(disc_tag):
     if isinstance(disc_tag, list):
         disc_tag = disc_tag[0]  # Use the first value
 
-    match = re.match(r"(\d+)\s*(?:[/\-of]\s*(\d+))?", str(disc_tag).strip(), re.IGNORECASE)
+    match = _DISC_RE.match(str(disc_tag).strip())
     if match:
         disc_number = int(match.group(1))
         total_discs = int(match.group(2)) if match.group(2) else None
@@ -116,37 +176,217 @@ def extract_disc_number(disc_tag):
 def get_metadata(file_path):
     """
     Extract metadata (artist, album artist, album, disc number) from a media file.
+    Results are cached, so later passes over the same file don't parse it again.
+
+    :param file_path: Path to the media file.
+    :return: Metadata object with extracted fields.
+    """
+    metadata = _METADATA_CACHE.get(file_path)
+    if metadata is None:
+        metadata = _METADATA_CACHE[file_path] = _read_metadata(file_path)
+    return metadata
+
+def _read_metadata(file_path):
+    """
+    Parse metadata from a media file with mutagen. Use get_metadata instead.
 
     :param file_path: Path to the media file.
     :return: Metadata object with extracted fields.
     """
     try:
-        audio_file = File(file_path, easy=True)
-        if audio_file:
-            artist = audio_file.get('artist', [None])[0]
-            album_artist = audio_file.get('albumartist', [None])[0]
-            album = audio_file.get('album', [None])[0]
-
-            # Try multiple possible keys for disc number
-            disc_raw = audio_file.get('discnumber', [None])[0] or audio_file.get('disc', [None])[0]
-
-            # Extract structured disc number data
-            disc, total_discs = extract_disc_number(disc_raw)
-
-            return Metadata(
-                artist=str(artist) if artist else None,
-                album_artist=str(album_artist) if album_artist else None,
-                album=str(album) if album else None,
-                disc=disc,  # Store as integer if valid
-                total_discs=total_discs,  # Store total number of discs
-                corrupt=False
-            )
+        return _metadata_from_audio(File(file_path, easy=True))
     except Exception:
         return Metadata(None, None, None, None, None, True)
 
+def _metadata_from_audio(audio_file):
+    """
+    Build a Metadata object from an already parsed mutagen file.
+
+    :param audio_file: Result of mutagen.File(..., easy=True), possibly None.
+    :return: Metadata object with extracted fields.
+    """
+    if audio_file:
+        artist = audio_file.get('artist', [None])[0]
+        album_artist = audio_file.get('albumartist', [None])[0]
+        album = audio_file.get('album', [None])[0]
+
+        # Try multiple possible keys for disc number
+        disc_raw = audio_file.get('discnumber', [None])[0] or audio_file.get('disc', [None])[0]
+
+        # Extract structured disc number data
+        disc, total_discs = extract_disc_number(disc_raw)
+
+        # Interned, so every track of an artist or album shares one string object
+        return Metadata(
+            artist=sys.intern(str(artist)) if artist else None,
+            album_artist=sys.intern(str(album_artist)) if album_artist else None,
+            album=sys.intern(str(album)) if album else None,
+            disc=disc,  # Store as integer if valid
+            total_discs=total_discs,  # Store total number of discs
+            corrupt=False
+        )
+
     return Metadata(None, None, None, None, None, False)
 
+@dataclass(slots=True, frozen=True)
+class FileScan:
+    file_size: int
+    metadata: Metadata
+    duration: float | None  # Duration in seconds, None if it can't be read
+    mtime_ns: int | None = None  # Modification time the scan corresponds to, None if the file couldn't be read
+
+def scan_file(file_path, with_duration=True, ext=None):
+    """
+    Read the size, tags and duration of a media file through a single open,
+    instead of opening it once each for the size, the tags and the duration.
+    Common ID3v2 and FLAC tags are read straight from the file headers by fast_tags; anything else,
+    and MP3 durations, come from a single mutagen parse.
+
+    :param file_path: Path to the media file.
+    :param with_duration: Whether the duration is needed. If not, it may be left as None.
+    :param ext: Lowercase extension of the file without the dot, used to pick the tag parser.
+    :return: FileScan of the file.
+    """
+    duration = None
+    try:
+        with open(file_path, 'rb') as f:
+            stat_result = os.fstat(f.fileno())
+
+            fast = read_tags(f, ext)
+            if fast is not None and (fast[1] is not None or not with_duration):
+                tags, length, tagged = fast
+                metadata = _metadata_from_audio(tags)
+                if tagged:  # Like mutagen, which leaves untagged files without a duration
+                    duration = length
+            else:
+                # Tags and stream info come from the same parse
+                try:
+                    audio_file = File(f, easy=True)
+                    metadata = _metadata_from_audio(audio_file)
+                    if audio_file and audio_file.info:
+                        duration = audio_file.info.length
+                except Exception:
+                    metadata = Metadata(None, None, None, None, None, True)
+
+            drop_cached_pages(f.fileno())  # Done with this file; don't let the scan crowd out the page cache
+    except OSError as e:
+        print(f"Error reading {file_path}: {e}", file=sys.stderr)
+        return FileScan(0, Metadata(None, None, None, None, None, True), None)
+
+    return FileScan(stat_result.st_size, metadata, duration, stat_result.st_mtime_ns)
+
+DEFAULT_MANIFEST_PATH = os.path.join(os.path.expanduser("~"), ".cache", "music_stats", "manifest.sqlite")
+
+def _open_manifest(cache_path):
+    """
+    Open (and create if needed) the sqlite manifest used by --cache.
+
+    :param cache_path: Path to the sqlite file.
+    :return: sqlite3 connection.
+    """
+    directory = os.path.dirname(cache_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    connection = sqlite3.connect(cache_path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute("CREATE TABLE IF NOT EXISTS files "
+                       "(path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, tags TEXT)")
+    return connection
+
+def load_manifest(cache_path):
+    """
+    Load the scan manifest written by previous runs.
+
+    :param cache_path: Path to the sqlite file.
+    :return: Dictionary of file path -> (size, mtime_ns, tags), empty if it can't be read.
+    """
+    try:
+        connection = _open_manifest(cache_path)
+        try:
+            return {path: (size, mtime_ns, tags)
+                    for path, size, mtime_ns, tags in connection.execute("SELECT path, size, mtime_ns, tags FROM files")}
+        finally:
+            connection.close()
+    except (OSError, sqlite3.Error) as e:
+        print(f"Error reading cache {cache_path}: {e}", file=sys.stderr)
+        return {}
+
+def save_manifest(cache_path, rows):
+    """
+    Store new or changed scans in the manifest, in a single transaction.
+
+    :param cache_path: Path to the sqlite file.
+    :param rows: Iterable of (path, size, mtime_ns, tags) tuples as built by manifest_row.
+    """
+    try:
+        connection = _open_manifest(cache_path)
+        try:
+            with connection:
+                connection.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", rows)
+        finally:
+            connection.close()
+    except (OSError, sqlite3.Error) as e:
+        print(f"Error writing cache {cache_path}: {e}", file=sys.stderr)
+
+def manifest_row(file_path, scan):
+    """
+    Build the manifest row for a FileScan.
+
+    :param file_path: Path to the media file.
+    :param scan: FileScan of the file.
+    :return: Tuple (path, size, mtime_ns, tags) with the tags stored as JSON.
+    """
+    metadata = scan.metadata
+    tags = json_dumps([metadata.artist, metadata.album_artist, metadata.album, metadata.disc,
+                       metadata.total_discs, metadata.corrupt, scan.duration])
+    return file_path, scan.file_size, scan.mtime_ns, tags
+
+def scan_from_manifest(file_path, entry, with_duration=True):
+    """
+    Rebuild a FileScan from a manifest entry, if the file hasn't changed since it was stored.
+    Costs a stat instead of opening and parsing the file.
+
+    :param file_path: Path to the media file.
+    :param entry: Tuple (size, mtime_ns, tags) from load_manifest.
+    :param with_duration: Whether the duration is needed. Entries stored without one are then treated as stale.
+    :return: FileScan of the file, or None if the entry is stale.
+    """
+    size, mtime_ns, tags = entry
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
+        return None
+    if stat_result.st_size != size or stat_result.st_mtime_ns != mtime_ns:
+        return None
+
+    artist, album_artist, album, disc, total_discs, corrupt, duration = json_loads(tags)
+    if with_duration and duration is None and not corrupt:
+        return None
+    metadata = Metadata(
+        artist=sys.intern(artist) if artist else None,
+        album_artist=sys.intern(album_artist) if album_artist else None,
+        album=sys.intern(album) if album else None,
+        disc=disc,
+        total_discs=total_discs,
+        corrupt=corrupt
+    )
+    return FileScan(size, metadata, duration, mtime_ns)
+
+
+# Words kept lowercase by normalize_capitalization unless they start the text
+_TITLE_EXCEPTIONS = frozenset({"a", "an", "and", "as", "at", "but", "by",
+                               "for", "in", "nor", "of", "on", "or", "the", "up"})
+
+ROMAN_NUMERALS = frozenset({
+    'I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX', 'X',
+    'XI', 'XII', 'XIII', 'XIV', 'XV', 'XVI', 'XVII', 'XVIII',
+    'XIX', 'XX', 'XXX', 'XL', 'L', 'LX', 'LXX', 'LXXX', 'XC',
+    'C', 'CC', 'CCC', 'CD', 'D', 'DC', 'DCC', 'DCCC', 'CM',
+    'M', 'MM', 'MMM'
+})
 
+@lru_cache(maxsize=4096)
 def is_roman_numeral(word):
     """
     Check if a word is a valid Roman numeral.
@@ -154,14 +394,7 @@ def is_roman_numeral(word):
     :param word: The word to check.
     :return: True if it's a Roman numeral, False otherwise.
     """
-    roman_numerals = {
-        'I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX', 'X',
-        'XI', 'XII', 'XIII', 'XIV', 'XV', 'XVI', 'XVII', 'XVIII',
-        'XIX', 'XX', 'XXX', 'XL', 'L', 'LX', 'LXX', 'LXXX', 'XC',
-        'C', 'CC', 'CCC', 'CD', 'D', 'DC', 'DCC', 'DCCC', 'CM',
-        'M', 'MM', 'MMM'
-    }
-    return word.upper() in roman_numerals
+    return word.upper() in ROMAN_NUMERALS
 
 def normalize_capitalization(text, exceptions):
     """
@@ -169,15 +402,26 @@ def normalize_capitalization(text, exceptions):
     preserving all-caps words, Roman numerals, brackets, dashes, and slashes.
 
     :param text: The text to normalize.
-    :param exceptions: A set of exception words to keep lowercase.
+    :param exceptions: A frozenset of exception words to keep lowercase.
     :return: Normalized text.
     """
     if not text:
         return text
+    if not isinstance(exceptions, frozenset):
+        exceptions = frozenset(exceptions)
+    return _normalize_capitalization_cached(text, exceptions)
+
+def _normalize_capitalization_uncached(text, exceptions):
+    """
+    Body of normalize_capitalization, called through the _normalize_capitalization_cached memo.
+    Artist and album strings repeat across every track of an album, so most calls are cache hits.
 
-    # Pattern to match bracketed substrings
-    pattern = r'(\[.*?\]|\(.*?\)|\{.*?\})'
-    parts = re.split(pattern, text)
+    :param text: The text to normalize.
+    :param exceptions: A frozenset of exception words to keep lowercase.
+    :return: Normalized text.
+    """
+    # Split out bracketed substrings
+    parts = _BRACKET_RE.split(text)
 
     normalized_parts = []
     for part in parts:
@@ -204,19 +448,33 @@ def normalize_capitalization(text, exceptions):
 
     return ''.join(normalized_parts)
 
+DEFAULT_NORMALIZE_CACHE_SIZE = 131072
+_normalize_capitalization_cached = lru_cache(maxsize=DEFAULT_NORMALIZE_CACHE_SIZE)(_normalize_capitalization_uncached)
+
+def set_normalize_cache_size(maxsize):
+    """
+    Resize the memo used by normalize_capitalization. The memo is only rebuilt
+    (and so emptied) when the size actually changes.
+
+    :param maxsize: Maximum number of cached strings, 0 disables caching.
+    """
+    global _normalize_capitalization_cached
+    if _normalize_capitalization_cached.cache_parameters()['maxsize'] != maxsize:
+        _normalize_capitalization_cached = lru_cache(maxsize=maxsize)(_normalize_capitalization_uncached)
+
 def normalize_capitalization_inner(text, exceptions):
     """
     Helper function to normalize capitalization for a segment of text.
 
     :param text: The text segment to normalize.
-    :param exceptions: A set of exception words to keep lowercase.
+    :param exceptions: A frozenset of exception words to keep lowercase.
     :return: Normalized text segment.
     """
     if not text:
         return text
 
     # Split by whitespace, keeping delimiters
-    words = re.split(r'(\s+)', text)
+    words = _WS_SPLIT_RE.split(text)
     normalized_words = []
     for i, word in enumerate(words):
         if word.isspace():
@@ -224,37 +482,22 @@ def normalize_capitalization_inner(text, exceptions):
             normalized_words.append(word)
             continue
 
-        # Handle words with dashes or slashes
-        if '-' in word or '/' in word:
-            # Determine which separators are present
-            separators = []
-            if '-' in word:
-                separators.append('-')
-            if '/' in word:
-                separators.append('/')
-
-            # To handle multiple different separators, process one separator at a time
-            for sep in separators:
-                if sep in word:
-                    subwords = word.split(sep)
-                    normalized_subwords = []
-                    for j, subword in enumerate(subwords):
-                        # Check if the subword is in exceptions and not the first subword
-                        if j != 0 and subword.lower() in exceptions:
-                            normalized_subwords.append(subword.lower())
-                            continue
-
-                        # Check if the subword is all uppercase or a Roman numeral
-                        if subword.isupper() or is_roman_numeral(subword):
-                            normalized_subwords.append(subword)
-                            continue
-
-                        # Otherwise, capitalize the first letter and lowercase the rest
-                        normalized_subwords.append(subword.capitalize())
-
-                    # Rejoin the subwords with the separator
-                    word = sep.join(normalized_subwords)
-            normalized_words.append(word)
+        # Handle words with dashes or slashes (one scan of the word for both)
+        if not _SEP_SET.isdisjoint(word):
+            # Split once on both separators, keeping them: [subword, sep, subword, sep, ...]
+            parts = _SEP_RE.split(word)
+            for j in range(0, len(parts), 2):
+                subword = parts[j]
+                # Check if the subword is in exceptions and not the first subword
+                if j != 0 and subword.lower() in exceptions:
+                    parts[j] = subword.lower()
+                # Check if the subword is all uppercase or a Roman numeral
+                elif subword.isupper() or is_roman_numeral(subword):
+                    continue
+                # Otherwise, capitalize the first letter and lowercase the rest
+                else:
+                    parts[j] = subword.capitalize()
+            normalized_words.append(''.join(parts))
             continue
 
         lower_word = word.lower()
@@ -283,16 +526,22 @@ def get_unique_log_filename(current_working_dir, log_type, date_stamp, scanned_d
     :param scanned_dir_basename: Basename of the directory being scanned.
     :return: Unique log file path.
     """
-    # Start with suffix _0
-    filename = f"{scanned_dir_basename}_{log_type}_{date_stamp}_0.txt"
-    filepath = os.path.join(current_working_dir, filename)
-    counter = 1
-    # Increment suffix until an available filename is found
-    while os.path.exists(filepath):
-        filename = f"{scanned_dir_basename}_{log_type}_{date_stamp}_{counter}.txt"
-        filepath = os.path.join(current_working_dir, filename)
-        counter += 1
-    return filepath
+    prefix = f"{scanned_dir_basename}_{log_type}_{date_stamp}"
+    log_re = re.compile(rf"^{re.escape(prefix)}_(\d+)\.txt$")
+
+    # Scan the directory once and continue after the highest existing suffix
+    suffixes = []
+    try:
+        with os.scandir(current_working_dir) as entries:
+            for entry in entries:
+                match = log_re.match(entry.name)
+                if match:
+                    suffixes.append(int(match.group(1)))
+    except FileNotFoundError:
+        pass
+
+    counter = max(suffixes, default=-1) + 1
+    return os.path.join(current_working_dir, f"{prefix}_{counter}.txt")
 
 def print_section_header(title, width=80):
     """
@@ -322,8 +571,7 @@ def log_missing_metadata(file_list, log_type):
 
     print_section_header(f"FILES MISSING METADATA: {log_type}")
     if file_list:
-        for file_path in file_list:
-            print(f"{file_path}")
+        sys.stdout.write('\n'.join(file_list) + '\n')
     else:
         print("No files missing metadata.")
 
@@ -357,22 +605,23 @@ def log_redundant_tracks(redundant_tracks):
         print("No redundant tracks found.")
         return
 
-    print("Note: Tracks listed here are found to have matching contents and metadata")
-    print("-" * 80)
+    lines = ["Note: Tracks listed here are found to have matching contents and metadata", "-" * 80]
     for track1, track2 in redundant_tracks:
-        print(f"Duplicate Pair:")
-        print(f"1. {track1.file_path}")
-        print(f"   Artist: {track1.artist}")
-        print(f"   Album Artist: {track1.album_artist}")
-        print(f"   Album: {track1.album}")
-        print(f"   File Size: {track1.file_size} bytes\n")
-
-        print(f"2. {track2.file_path}")
-        print(f"   Artist: {track2.artist}")
-        print(f"   Album Artist: {track2.album_artist}")
-        print(f"   Album: {track2.album}")
-        print(f"   File Size: {track2.file_size} bytes")
-        print("-" * 80 + "")
+        lines.extend((
+            "Duplicate Pair:",
+            f"1. {track1.file_path}",
+            f"   Artist: {track1.artist}",
+            f"   Album Artist: {track1.album_artist}",
+            f"   Album: {track1.album}",
+            f"   File Size: {track1.file_size} bytes\n",
+            f"2. {track2.file_path}",
+            f"   Artist: {track2.artist}",
+            f"   Album Artist: {track2.album_artist}",
+            f"   Album: {track2.album}",
+            f"   File Size: {track2.file_size} bytes",
+            "-" * 80,
+        ))
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def log_redundant_albums(album_tree):
@@ -385,32 +634,31 @@ def log_redundant_albums(album_tree):
     print_section_header("REDUNDANT/MISTAGGED ALBUMS")
 
     # First, check if we even have any red. albums. If not, return and exit.
-    has_redundant_albums:bool = False
-    for album in album_tree.values():
-        if len(album.redundant) > 0:
-            has_redundant_albums = True
-            break
-
-    if not has_redundant_albums:
+    if not any(album.redundant for album in album_tree.values()):
         print("No redundant or mistagged albums detected")
         return  # Exit function early
 
-    print("Note: Albums listed here are either redundant or missing disc tags")
+    lines = ["Note: Albums listed here are either redundant or missing disc tags"]
     for album in album_tree.values():
 
         if len(album.redundant) > 0:
-            print("-" * 80)
-            print(f"Album Name : {album.album_name}")
-            print(f"Artist     : {album.artist}")
-            print(f"Path       : {album.path}")
-            print(f"Track Count: {album.track_count}")
+            lines.extend((
+                "-" * 80,
+                f"Album Name : {album.album_name}",
+                f"Artist     : {album.artist}",
+                f"Path       : {album.path}",
+                f"Track Count: {album.track_count}",
+            ))
 
             for redundant_album in album.redundant:
-                print(f"\nAlbum Name : {redundant_album.album_name}")
-                print(f"Artist     : {redundant_album.artist}")
-                print(f"Path       : {redundant_album.path}")
-                print(f"Track Count: {redundant_album.track_count}")
-    print("-" * 80)
+                lines.extend((
+                    f"\nAlbum Name : {redundant_album.album_name}",
+                    f"Artist     : {redundant_album.artist}",
+                    f"Path       : {redundant_album.path}",
+                    f"Track Count: {redundant_album.track_count}",
+                ))
+    lines.append("-" * 80)
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 def eliminate_common_prefix(root_path, full_path):
     """
@@ -430,17 +678,18 @@ def eliminate_common_prefix(root_path, full_path):
 
     return full_path  # If the path wasn't inside root_path, return as-is
 
-def truncate_string(s, max_length=25):
+def _fit(s, width):
     """
-    Truncate a string to a maximum length, appending '...' if truncated.
+    Fit a string into a fixed-width column: truncate it with '...' if it is too long,
+    otherwise pad it with spaces.
 
-    :param s: The string to truncate.
-    :param max_length: The maximum allowed length of the string.
-    :return: The truncated string.
+    :param s: The string to fit.
+    :param width: The column width.
+    :return: A string exactly width characters long.
     """
-    if len(s) > max_length:
-        return s[:max_length - 3] + "..."
-    return s
+    if len(s) > width:
+        return s[:width - 3] + "..."
+    return s.ljust(width)
 
 def extract_disc_info(input_string):
     """
@@ -449,11 +698,11 @@ def extract_disc_info(input_string):
     :param input_string: The original string containing "(Disc n)" optionally.
     :return: Tuple (cleaned_string, disc_number)
     """
-    match = re.search(r"\(Disc (\d+)\)", input_string, re.IGNORECASE)
+    match = _DISC_INFO_RE.search(input_string)
 
     if match:
         disc_number = match.group(1)  # Extracts the number
-        cleaned_string = re.sub(r"\s*\(Disc \d+\)", "", input_string)  # Removes "(Disc n)"
+        cleaned_string = _DISC_STRIP_RE.sub("", input_string)  # Removes "(Disc n)"
     else:
         disc_number = "0"
         cleaned_string = input_string  # Keep the string as-is
@@ -495,10 +744,10 @@ def log_all_albums(album_tree, root_path):
             })
 
     # Sort the albums alphabetically by album_artist, then by artist, then by album
-    all_albums_sorted = sorted(
-        all_albums,
-        key=lambda x: (x['album_artist'].lower(), x['artist'].lower(), x['album'].lower())
-    )
+    # Build the lowercase key in a plain loop so sorted() reads it with itemgetter instead of calling a lambda
+    for album in all_albums:
+        album['_sort_key'] = (album['album_artist'].lower(), album['artist'].lower(), album['album'].lower())
+    all_albums_sorted = sorted(all_albums, key=itemgetter('_sort_key'))
 
     # Define column widths
     COLUMN_WIDTHS = {
@@ -510,70 +759,68 @@ def log_all_albums(album_tree, root_path):
         'path': 95
     }
 
+    # Row templates parsed once; the Tracks/Disc widths exclude their labels
+    HEADER_FMT = "\n{:<25} | {:<40} | {:<25} | {:<11} | {:<11} | {:<95}"
+    ROW_FMT = "{:<25} | {:<40} | {:<25} | Tracks: {:<3} | Disc: {:<1} | {:<95}"
+
     # Write Header
-    header = (
-        f"{'\nALBUM ARTIST'.ljust(COLUMN_WIDTHS['album_artist'])} | "
-        f"{'ALBUM'.ljust(COLUMN_WIDTHS['album'])} | "
-        f"{'ARTIST'.ljust(COLUMN_WIDTHS['artist'])} | "
-        f"{'TRACK COUNT'.ljust(COLUMN_WIDTHS['track_count'])} | "
-        f"{'DISC NUMBER'.ljust(COLUMN_WIDTHS['track_count'])} | "
-        f"{'PATH'.ljust(COLUMN_WIDTHS['path'])}"
-    )
-    print(header)
-    print("=" * (sum(COLUMN_WIDTHS.values()) + 9))  # 9 for separators and spaces
+    header = HEADER_FMT.format('ALBUM ARTIST', 'ALBUM', 'ARTIST', 'TRACK COUNT', 'DISC NUMBER', 'PATH')
+    lines = [header, "=" * (sum(COLUMN_WIDTHS.values()) + 9)]  # 9 for separators and spaces
 
     # Write Album Entries
     for album in all_albums_sorted:
         # Truncate metadata strings if necessary
-        album_artist = truncate_string(album['album_artist'], COLUMN_WIDTHS['album_artist'])
-        artist = truncate_string(album['artist'], COLUMN_WIDTHS['artist'])
+        album_artist = _fit(album['album_artist'], COLUMN_WIDTHS['album_artist'])
+        artist = _fit(album['artist'], COLUMN_WIDTHS['artist'])
 
         # Parse album name from concatenated string [Epicloud (Disc 1) -> Epicloud]
         cleaned, disc_num_str = extract_disc_info(album['album'])
-        album_name = truncate_string(cleaned, COLUMN_WIDTHS['album'])
-        path = truncate_string(eliminate_common_prefix(root_path, album['path']), COLUMN_WIDTHS['path'])
+        album_name = _fit(cleaned, COLUMN_WIDTHS['album'])
+        path = _fit(eliminate_common_prefix(root_path, album['path']), COLUMN_WIDTHS['path'])
 
         # Format each line with fixed-width columns
-        line = (
-            f"{album_artist.ljust(COLUMN_WIDTHS['album_artist'])} | "
-            f"{album_name.ljust(COLUMN_WIDTHS['album'])} | "
-            f"{artist.ljust(COLUMN_WIDTHS['artist'])} | "
-            f"{'Tracks: ' + str(album['track_count']).ljust(COLUMN_WIDTHS['track_count'] - 8)} | "
-            f"{'Disc: ' + disc_num_str.ljust(COLUMN_WIDTHS['disc_number'] - 8)} | "
-            f"{path.ljust(COLUMN_WIDTHS['path'])}"
-        )
-        print(line)
+        lines.append(ROW_FMT.format(album_artist, album_name, artist, album['track_count'], disc_num_str, path))
 
+    # One write for the whole table instead of a print per album
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
-def find_redundant_tracks(crc_map):
+def find_redundant_tracks(all_tracks):
     """
-    Identify redundant (duplicate) tracks based on CRC and file size.
+    Identify redundant (duplicate) tracks based on content hash, file size and metadata.
+
+    Tracks are first bucketed by the integer key (content_hash, file_size), which rules out almost
+    every track without touching its strings. Only buckets with two or more tracks are
+    split further by the ids of (artist, album_artist, album), and pairs are generated inside those.
+    The ids come from a mapping local to this call, so it is freed once the groups are built.
 
-    :param crc_map: Dictionary mapping CRC values to lists of Tracks.
+    :param all_tracks: List of Track instances.
     :return: Tuple of (list of redundant Track pairs, count of duplicates).
     """
-    redundant_tracks = []
-    duplicates_count = 0
+    candidates = defaultdict(list)
+    for track in all_tracks:
+        if track.content_hash is None:
+            continue  # Skip tracks that couldn't be hashed
+        candidates[(track.content_hash, track.file_size)].append(track)
+
+    # Metadata string -> small integer id, the same for equal strings
+    interner = {}
 
-    for crc, tracks in crc_map.items():
+    def intern(s):
+        return interner.setdefault(s, len(interner))
+
+    redundant_tracks = []
+    for tracks in candidates.values():
         if len(tracks) < 2:
-            continue  # No duplicates if less than 2 tracks share the CRC
-
-        # Compare each track with every other track in the list
-        for i in range(len(tracks)):
-            for j in range(i + 1, len(tracks)):
-                track1 = tracks[i]
-                track2 = tracks[j]
-                if track1.file_size == track2.file_size:
-                    # Further verify by comparing metadata fields
-                    if (track1.artist == track2.artist and
-                        track1.album_artist == track2.album_artist and
-                        track1.album == track2.album):
-                        redundant_tracks.append((track1, track2))
-                        duplicates_count += 1
-
-    return redundant_tracks, duplicates_count
+            continue
+        groups = defaultdict(list)
+        for track in tracks:
+            groups[(intern(track.artist), intern(track.album_artist), intern(track.album))].append(track)
+        for group in groups.values():
+            if len(group) > 1:
+                redundant_tracks.extend(combinations(group, 2))
+
+    return redundant_tracks, len(redundant_tracks)
 
 def normalize_and_save_metadata(file_path, artist, album_artist, album, exceptions, normalized_updates, verbose):
     """
@@ -641,6 +888,7 @@ def normalize_and_save_metadata(file_path, artist, album_artist, album, exceptio
 
         if updated:
             audio_file.save()
+            invalidate_file_cache(file_path)
             if verbose:
                 print(f"Metadata updated for file: {file_path}")
 
@@ -663,21 +911,22 @@ def prompt_fix_metadata(missing_folders, metadata_type, exceptions, media_extens
         print("Affected files:")
         # Gather all relevant files in the folder with missing metadata
         affected_files = []
-        for file_path in os.listdir(folder):
-            full_path = os.path.join(folder, file_path)
-            if os.path.isfile(full_path) and not file_path.startswith('.'):
-                # Check if the specific metadata is missing
-                metadata = get_metadata(full_path)
-
-                if metadata.corrupt:
-                    print(f"Error: file '{file_path}' is corrupt!")
-                else:
-                    if metadata_type == 'album_artist' and not metadata.album_artist:
-                        affected_files.append(full_path)
-                    elif metadata_type == 'album' and not metadata.album:
-                        affected_files.append(full_path)
-                    elif metadata_type == 'artist' and not metadata.artist:
-                        affected_files.append(full_path)
+        # scandir takes the file type from the directory listing (d_type), so nothing is stat'ed here
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if not entry.name.startswith('.') and entry.is_file():
+                    # Check if the specific metadata is missing
+                    metadata = get_metadata(entry.path)
+
+                    if metadata.corrupt:
+                        print(f"Error: file '{entry.name}' is corrupt!")
+                    else:
+                        if metadata_type == 'album_artist' and not metadata.album_artist:
+                            affected_files.append(entry.path)
+                        elif metadata_type == 'album' and not metadata.album:
+                            affected_files.append(entry.path)
+                        elif metadata_type == 'artist' and not metadata.artist:
+                            affected_files.append(entry.path)
 
         if not affected_files:
             print("No affected files found.")
@@ -725,6 +974,7 @@ def prompt_fix_metadata(missing_folders, metadata_type, exceptions, media_extens
                     audio_file['artist'] = normalized_input
                     audio_file.save()
                     print(f"Set Artist for {file_path} to '{normalized_input}'")
+                invalidate_file_cache(file_path)
             except Exception as e:
                 print(f"Error setting {metadata_type.replace('_', ' ').capitalize()} for {file_path}: {e}", file=sys.stderr)
 
@@ -741,7 +991,7 @@ def update_status_bar(status_bar, file_name, total_files, total_size, total_dura
     total_size_gb = total_size / (1000**3)  # Decimal GB
     total_size_gib = total_size / (1024**3)  # Binary GiB
     total_duration_hms = f"(h:m:s) {int(total_duration // 3600)}:{int((total_duration % 3600) // 60)}:{int(total_duration % 60)}"
-    truncated_file_name = truncate_file_name(file_name, max_length=30)
+    truncated_file_name = _fit(file_name, 30)
 
     status_bar.set_postfix({
         "Files": total_files,
@@ -751,26 +1001,18 @@ def update_status_bar(status_bar, file_name, total_files, total_size, total_dura
     })
     status_bar.update(1)
 
-def build_crc_map(all_tracks):
+def count_hash_collisions(all_tracks):
     """
-    Build a CRC map from a list of Tracks.
+    Count tracks whose content hash was already seen on an earlier track.
 
     :param all_tracks: List of Track instances.
-    :return: Tuple of (crc_map, crc_collision_count).
+    :return: Number of hash collisions.
     """
-    crc_map = defaultdict(list)
-    crc_collision_count = 0
-
-    for track in all_tracks:
-        if track.crc is None:
-            continue  # Skip tracks with failed CRC computation
-        if crc_map[track.crc]:
-            crc_collision_count += 1
-        crc_map[track.crc].append(track)
-
-    return crc_map, crc_collision_count
+    # Skip tracks that weren't hashed; the count is the number of hashes minus the distinct ones
+    hashes = [track.content_hash for track in all_tracks if track.content_hash is not None]
+    return len(hashes) - len(set(hashes))
 
-@dataclass
+@dataclass(slots=True)
 class Album:
     album_name: str
     artist: str
@@ -778,35 +1020,66 @@ class Album:
     album_artist: str
     track_count: int = 1
     redundant: List['Album'] = field(default_factory=list)
+    redundant_by_path: dict = field(default_factory=dict, repr=False)  # path -> Album in redundant
+    _album_artist_lc: str = field(init=False, repr=False)  # album_artist.lower(), used for comparisons
+
+    def __post_init__(self):
+        self._album_artist_lc = self.album_artist.lower()
 
-def extract_all_albums(album_tree):
+def merge_album_trees(album_trees):
     """
-    Extracts all albums from an album tree, including redundant albums.
+    Merges multiple album trees into a single album tree by inserting every album
+    (and each of its redundant albums) directly using insert_album.
+
+    Each worker process builds its own tree, so the largest one is already consistent
+    and is adopted as the base (and modified in place); only the others are re-inserted.
     """
-    album_list = []
-    for album in album_tree.values():
-        album_list.append(album)
-        album_list.extend(album.redundant)  # Add redundant albums separately
-    return album_list
+    if not album_trees:
+        return {}
 
+    album_trees = sorted(album_trees, key=len, reverse=True)
+    merged_tree = album_trees[0]
 
-def merge_album_trees(album_trees):
+    for album_tree in album_trees[1:]:
+        for album in album_tree.values():
+            insert_album(merged_tree, album.album_name, album.artist, album.path, album.album_artist, album.track_count)
+            for redundant in album.redundant:
+                insert_album(merged_tree, redundant.album_name, redundant.artist, redundant.path,
+                             redundant.album_artist, redundant.track_count)
+
+    return merged_tree
+
+@lru_cache(maxsize=65536)
+def _lc(s):
     """
-    Merges multiple album trees into a single album tree by flattening them into a list first,
-    then inserting them one by one using insert_album.
+    Lowercase (and intern) a string. Cached, since every track of an album
+    asks for the same album and album artist keys.
+
+    :param s: String to lowercase.
+    :return: Interned lowercase string.
     """
-    merged_tree = {}
-    all_albums = []
+    return sys.intern(s.lower())
 
-    # Flatten all trees into a list of albums
-    for album_tree in album_trees:
-        all_albums.extend(extract_all_albums(album_tree))
+def promote_redundant_album(album_tree, album_key, promoted):
+    """
+    Make a redundant album the base album of its entry in the album tree.
+    The former base album takes its place in the redundant list.
 
-    # Insert all extracted albums into the merged tree
-    for album in all_albums:
-        insert_album(merged_tree, album.album_name, album.artist, album.path, album.album_artist, album.track_count)
+    :param album_tree: Dictionary representing the album tree.
+    :param album_key: Key of the entry in the album tree.
+    :param promoted: Redundant Album of that entry to promote.
+    """
+    demoted = album_tree[album_key]
+    redundant = demoted.redundant
+    redundant_by_path = demoted.redundant_by_path
 
-    return merged_tree
+    redundant[redundant.index(promoted)] = demoted
+    del redundant_by_path[promoted.path]
+    redundant_by_path[demoted.path] = demoted
+
+    promoted.redundant, promoted.redundant_by_path = redundant, redundant_by_path
+    demoted.redundant, demoted.redundant_by_path = [], {}
+    album_tree[album_key] = promoted
 
 def insert_album(album_tree, album_name, artist, folder_path, album_artist, track_count=1):
     """
@@ -824,8 +1097,14 @@ def insert_album(album_tree, album_name, artist, folder_path, album_artist, trac
     if not album_name or not album_artist:
         return False, False  # Cannot process without album or album_artist
 
-    album_key = str(album_name).lower()
-    album_artist_key = str(album_artist).lower()
+    # Interned, so the keys and the strings stored on Albums are shared across all tracks of an album
+    # and comparisons between them mostly hit the identity fast path
+    album_key = _lc(str(album_name))
+    album_artist_key = _lc(str(album_artist))
+    folder_path = sys.intern(folder_path)
+    album_artist = sys.intern(str(album_artist))
+    if artist:
+        artist = sys.intern(str(artist))
 
     if album_key not in album_tree:
         # New album
@@ -839,27 +1118,21 @@ def insert_album(album_tree, album_name, artist, folder_path, album_artist, trac
         return True, False  # is_new_album, is_redundant
     else:
         existing_album = album_tree[album_key]
-        if existing_album.album_artist.lower() == album_artist_key and existing_album.path == folder_path:
+        if existing_album._album_artist_lc == album_artist_key and existing_album.path == folder_path:
             # Exact match, increment track count
             existing_album.track_count += track_count
             return False, False
-        elif existing_album.album_artist.lower() == album_artist_key and existing_album.path != folder_path:
+        elif existing_album._album_artist_lc == album_artist_key and existing_album.path != folder_path:
             # Same album and album_artist but different path, check redundancy
-            duplicate = False
-            for redundant_album in existing_album.redundant:
-                if redundant_album.path == folder_path:
-                    redundant_album.track_count += track_count
-                    duplicate = True
-
-                    # Check if this redundant album has now grown larger than the base album
-                    if redundant_album.track_count > existing_album.track_count:
-                        # Swap base album with the larger redundant album
-                        existing_album.album_name, redundant_album.album_name = redundant_album.album_name, existing_album.album_name
-                        existing_album.artist, redundant_album.artist = redundant_album.artist, existing_album.artist
-                        existing_album.album_artist, redundant_album.album_artist = redundant_album.album_artist, existing_album.album_artist
-                        existing_album.path, redundant_album.path = redundant_album.path, existing_album.path
-                        existing_album.track_count, redundant_album.track_count = redundant_album.track_count, existing_album.track_count
-                    break
+            redundant_album = existing_album.redundant_by_path.get(folder_path)
+            duplicate = redundant_album is not None
+            if duplicate:
+                redundant_album.track_count += track_count
+
+                # Check if this redundant album has now grown larger than the base album
+                if redundant_album.track_count > existing_album.track_count:
+                    # Swap base album with the larger redundant album
+                    promote_redundant_album(album_tree, album_key, redundant_album)
 
             if not duplicate:
                 new_redundant = Album(
@@ -870,15 +1143,12 @@ def insert_album(album_tree, album_name, artist, folder_path, album_artist, trac
                     path=folder_path
                 )
                 existing_album.redundant.append(new_redundant)
+                existing_album.redundant_by_path[folder_path] = new_redundant
 
                 # Check if the new redundant album has more tracks than the base
                 if new_redundant.track_count > existing_album.track_count:
                     # Swap the base album with the redundant album
-                    existing_album.album_name, new_redundant.album_name = new_redundant.album_name, existing_album.album_name
-                    existing_album.artist, new_redundant.artist = new_redundant.artist, existing_album.artist
-                    existing_album.album_artist, new_redundant.album_artist = new_redundant.album_artist, existing_album.album_artist
-                    existing_album.path, new_redundant.path = new_redundant.path, existing_album.path
-                    existing_album.track_count, new_redundant.track_count = new_redundant.track_count, existing_album.track_count
+                    promote_redundant_album(album_tree, album_key, new_redundant)
 
                 return False, True
             else:
@@ -908,22 +1178,20 @@ def print_album_statistics(album_tree, list_redundant_albums):
     :param list_redundant_albums: Lists redundant albums if set
     :param album_tree: Dictionary representing the album tree.
     """
-    total_albums = 0
+    # The tree is already deduplicated (one entry per album, copies hang off its redundant list),
+    # so the counts are sizes rather than something to tally album by album
+    total_albums = len(album_tree)
     redundant_albums = 0
     redundant_track_count = 0
+    # If you have track durations and sizes per album, aggregate them over the redundant albums
+    # For simplicity, these are left as placeholders
     #redundant_total_size = 0
     #redundant_total_duration = 0.0
 
-    for album in album_tree.values():
-        total_albums += 1
-        for redundant in album.redundant:
-            redundant_albums += 1
-            redundant_track_count += redundant.track_count
-            #print(f"track count {redundant.track_count}, name {redundant.album_name}, path {redundant.path}")
-            # If you have track durations and sizes per album, aggregate them here
-            # For simplicity, these are left as placeholders
-            # redundant_total_size += calculate_size(redundant)
-            # redundant_total_duration += calculate_duration(redundant)
+    if list_redundant_albums:
+        redundant_lists = [album.redundant for album in album_tree.values() if album.redundant]
+        redundant_albums = sum(map(len, redundant_lists))
+        redundant_track_count = sum(redundant.track_count for redundant in chain.from_iterable(redundant_lists))
 
     print(f"Total number of albums: {total_albums}")
     if list_redundant_albums:
@@ -940,7 +1208,8 @@ def format_elapsed_time(elapsed_seconds):
     return f"{hours:02}:{minutes:02}:{seconds:02}"
 
 
-@dataclass
+# No slots: frozen slotted dataclasses can't be pickled to the worker processes on Python 3.10.0 (bpo-45897)
+@dataclass(frozen=True)
 class ProcessingOptions:
     verbose: bool = False
     list_unknown_artist: bool = False
@@ -956,8 +1225,10 @@ class ProcessingOptions:
     remove_windows_hidden_files: bool = False
     count_total_duration: bool = False
     threads:int = 0 # 0 indicates 2 * cores
+    normalize_cache_size: int = DEFAULT_NORMALIZE_CACHE_SIZE # Strings memoized by normalize_capitalization
+    manifest_cache: str | None = None # Path of the sqlite scan manifest, None disables it
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingBuffers:
     total_files: int = 0 # Total file count
     total_music_files: int = 0 # Music File count
@@ -971,6 +1242,7 @@ class ProcessingBuffers:
     thumbs_db_removed: int = 0
     folder_jpg_removed: int = 0
     album_art_small_removed: int = 0
+    ehthumbs_db_removed: int = 0
 
     supported_extensions: dict = field(default_factory=lambda: defaultdict(int))
     unsupported_extensions: dict = field(default_factory=lambda: defaultdict(int))
@@ -981,65 +1253,172 @@ class ProcessingBuffers:
     folders_missing_artist: set = field(default_factory=set)
     folders_missing_album_artist: set = field(default_factory=set)
     folders_missing_album: set = field(default_factory=set)
-    all_tracks: list = field(default_factory=list)
+    all_tracks: list = field(default_factory=list) # Only filled when listing redundant tracks
     album_tree: dict = field(default_factory=dict)
     total_albums: int = 0
     redundant_albums: int = 0
     corrupt_file_count: int = 0
     corrupt_files: list = field(default_factory=list)
+    manifest_updates: list = field(default_factory=list) # New rows for the --cache manifest
+
+
+# File categories for the summary of unsupported extensions
+IMAGE_EXTENSIONS = frozenset({
+    "jpg", "jpeg", "png", "gif", "bmp", "tiff", "tif", "ico", "", "thm", "webp", "svg", "raw", "heif", "heic"
+})
+
+VIDEO_EXTENSIONS = frozenset({
+    "mp4", "mkv", "avi", "mov", "wmv", "flv", "webm", "m4v", "mpg", "mpeg", "ogv", "3gp", "3g2", "rm", "rmvb"
+})
+
+# Lowercase names of Windows generated files -> ProcessingBuffers counter of removed files.
+# These names are only ever written by Windows, so they are matched case-insensitively.
+WINDOWS_BLOAT_FILES = {
+    'desktop.ini': 'desktop_ini_removed',
+    'thumbs.db': 'thumbs_db_removed',
+    'ehthumbs.db': 'ehthumbs_db_removed',  # Windows Media Center thumbnail caches
+    'ehthumbs_vista.db': 'ehthumbs_db_removed',
+}
+# Album art written by Windows Media Player -> ProcessingBuffers counter of removed files.
+# Other tools save cover art under similar names (e.g. folder.jpg), so only the exact names are removed.
+WINDOWS_ART_FILES = {
+    'AlbumArtSmall.jpg': 'album_art_small_removed',
+    'Folder.jpg': 'folder_jpg_removed',
+}
+# Their extensions, so most files are ruled out by the extension walk_entries already split off
+_WIN_HIDDEN_EXTENSIONS = frozenset(name.rpartition('.')[2].lower()
+                                   for name in (*WINDOWS_BLOAT_FILES, *WINDOWS_ART_FILES))
+
+# Filesystem types (as listed in /proc/mounts) whose reads go over the network
+NETWORK_FILESYSTEMS = frozenset({
+    'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'ncpfs', 'afs', '9p', 'ceph', 'glusterfs', 'davfs',
+    'fuse.sshfs', 'fuse.glusterfs', 'fuse.ceph', 'fuse.rclone', 'fuse.davfs',
+})
+
+def is_network_filesystem(path):
+    """
+    Check whether a path lives on a network filesystem, based on the longest matching
+    mount point in /proc/mounts. Returns False where that file isn't available.
 
+    :param path: Path to check.
+    :return: True if the filesystem holding the path is a network filesystem.
+    """
+    path = os.path.realpath(path)
+    best_mount, best_type = "", None
+    try:
+        with open('/proc/mounts') as mounts:
+            for line in mounts:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                # Spaces and other special characters in mount points are octal escaped (\040)
+                mount_point = fields[1]
+                if '\\' in mount_point:
+                    mount_point = _MOUNT_ESCAPE_RE.sub(lambda m: chr(int(m.group(1), 8)), mount_point)
+                if ((path == mount_point or path.startswith(mount_point.rstrip('/') + '/'))
+                        and len(mount_point) >= len(best_mount)):
+                    best_mount, best_type = mount_point, fields[2]
+    except OSError:
+        return False
+    return best_type in NETWORK_FILESYSTEMS
+
+def _scan_directory(directory):
+    """
+    List one directory with os.scandir, skipping hidden files.
 
-def process_file_multithreaded(file_path, options:ProcessingOptions, media_extensions, buffers):
+    No file is stat'ed: the file type comes from the directory listing (d_type).
+
+    :param directory: Directory to list.
+    :return: Tuple (files, subdirectories): list of (file_path, file_name, ext) tuples, ext being lowercase,
+             and list of subdirectory paths, both in listing order. Empty if the directory can't be read.
     """
-    Processes a single file and updates the given buffers.
+    files = []
+    subdirectories = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if not entry.is_symlink():  # Like os.walk, don't follow directory links
+                        subdirectories.append(entry.path)
+                elif not entry.name.startswith('.'):
+                    name = entry.name
+                    files.append((entry.path, name, name.rpartition('.')[2].lower()))
+    except OSError:
+        pass  # Unreadable directory, os.walk skips these too
+    return files, subdirectories
+
+def walk_entries(directory):
     """
-    file_name = os.path.basename(file_path)
-    ext = file_name.split('.')[-1].lower()
+    Recursively list the files under a directory with os.scandir, skipping hidden files.
+    Files come in the same order as os.walk would give them.
 
-    if options.verbose:
-        print(f"Processing file path {file_path}")
+    Each directory costs one scandir (getdents) pass and no file is stat'ed here; sizes
+    are taken later from the open file. The walk uses an explicit stack rather than nested
+    generators, so yielding a file doesn't pass through one generator frame per directory level.
 
-    buffers.total_files += 1
+    :param directory: Directory to walk.
+    :return: Generator of (file_path, file_name, ext) tuples, ext being lowercase.
+    """
+    stack = [directory]
+    while stack:
+        files, subdirectories = _scan_directory(stack.pop())
+        yield from files
 
-    if options.remove_windows_hidden_files:
-        if file_name.lower() == 'desktop.ini':
-            try:
-                if options.verbose:
-                    print(f"Removed: {file_path}")
-                os.remove(file_path)
-                buffers.desktop_ini_removed += 1
-            except Exception as e:
-                print(f"Error removing {file_path}: {e}", file=sys.stderr)
-            return
+        # Reversed, so subdirectories are popped (and walked) in listing order
+        stack.extend(reversed(subdirectories))
 
-        if file_name == 'Thumbs.db':
-            try:
-                if options.verbose:
-                    print(f"Removed: {file_path}")
-                os.remove(file_path)
-                buffers.thumbs_db_removed += 1
-            except Exception as e:
-                print(f"Error removing {file_path}: {e}", file=sys.stderr)
-            return
+PARALLEL_WALK_MIN_SUBDIRS = 4  # The top level needs more subdirectories than this to be walked in parallel
 
-        if file_name == 'AlbumArtSmall.jpg':
-            try:
-                if options.verbose:
-                    print(f"Removed: {file_path}")
-                os.remove(file_path)
-                buffers.album_art_small_removed += 1
-            except Exception as e:
-                print(f"Error removing {file_path}: {e}", file=sys.stderr)
-            return
+def walk_entries_parallel(directory, max_workers):
+    """
+    List the files under a directory like walk_entries, walking the top-level subdirectories
+    on a thread pool when there are more than PARALLEL_WALK_MIN_SUBDIRS of them (e.g. one per artist).
+    scandir releases the GIL while it waits on the filesystem, so the subtrees are read concurrently.
+    Small trees are walked serially, where starting threads would cost more than it saves.
+
+    :param directory: Directory to walk.
+    :param max_workers: Number of threads to walk with.
+    :return: List of (file_path, file_name, ext) tuples, in the same order as walk_entries.
+    """
+    files, subdirectories = _scan_directory(directory)
+    if len(subdirectories) <= PARALLEL_WALK_MIN_SUBDIRS or max_workers <= 1:
+        for subdirectory in subdirectories:
+            files.extend(walk_entries(subdirectory))
+        return files
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # map keeps the subtrees in listing order
+        for subtree in executor.map(lambda subdirectory: list(walk_entries(subdirectory)), subdirectories):
+            files.extend(subtree)
+    return files
+
+def process_file_multithreaded(file_path, file_name, ext, options:ProcessingOptions, media_extensions, buffers, remove_file,
+                               manifest):
+    """
+    Processes a single file and updates the given buffers.
+    The per-file totals are left to the caller to accumulate.
+
+    :param file_path: Path of the file.
+    :param file_name: Base name of the file.
+    :param ext: Lowercase extension of the file.
+    :param remove_file: Callable (file_path, counter_name) that deletes a file in the background
+                        and bumps the named ProcessingBuffers counter once it succeeds.
+    :param manifest: Dictionary of --cache manifest entries (see load_manifest), possibly empty.
+    :return: Tuple (file_size, duration) for a readable media file, otherwise None.
+    """
+    if options.verbose:
+        print(f"Processing file path {file_path}")
 
-        if file_name == 'Folder.jpg':
-            try:
-                if options.verbose:
-                    print(f"Removed: {file_path}")
-                os.remove(file_path)
-                buffers.folder_jpg_removed += 1
-            except Exception as e:
-                print(f"Error removing {file_path}: {e}", file=sys.stderr)
+    if options.remove_windows_hidden_files and ext in _WIN_HIDDEN_EXTENSIONS:
+        counter_name = WINDOWS_BLOAT_FILES.get(file_name.lower()) or WINDOWS_ART_FILES.get(file_name)
+        if counter_name is not None:
+            if options.verbose:
+                print(f"Removed: {file_path}")
+            remove_file(file_path, counter_name)
             return
 
     if ext in media_extensions:
@@ -1049,36 +1428,33 @@ def process_file_multithreaded(file_path, options:ProcessingOptions, media_exten
         # Increment file count and add to dictionary
         buffers.supported_extensions[ext] += 1
 
-        # Initialize track data
-        metadata = get_metadata(file_path)
+        # Size, tags and duration from the --cache manifest if the file is unchanged,
+        # otherwise from a single open of the file
+        cached = manifest.get(file_path)
+        scan = scan_from_manifest(file_path, cached, options.count_total_duration) if cached is not None else None
+        if scan is None:
+            scan = scan_file(file_path, with_duration=options.count_total_duration, ext=ext)
+            if options.manifest_cache and scan.mtime_ns is not None:
+                buffers.manifest_updates.append(manifest_row(file_path, scan))
+        metadata = scan.metadata
 
         if metadata.corrupt:  # Don't try to faff with corrupt files
             buffers.corrupt_file_count += 1
             buffers.corrupt_files.append(file_path)
             return
 
-        # Extremely slow to get duration of all files, so only tally if user specifies
+        # Only tally duration if the user specifies; a missing duration marks the file as corrupt
         if options.count_total_duration:
-            duration = get_duration(file_path)
-
-            if duration is None: # If we can't get the duration of a file, it is potentially corrupted
+            if scan.duration is None: # If we can't get the duration of a file, it is potentially corrupted
                 buffers.corrupt_file_count += 1
                 buffers.corrupt_files.append(file_path)
                 return
-            else:
-                buffers.total_duration += duration
-
-        file_size = get_file_size(file_path) or 0
 
-        # Computing CRC is slow, so only compute if told
-        crc=0
-        if options.list_redundant_tracks:
-            crc = compute_crc32(file_path)
-
-        buffers.total_media_files += 1
-        buffers.total_size += file_size
-
-        folder_path = os.path.dirname(file_path)
+        # walk_entries builds file_path as directory + '/' + file_name, so the directory can be sliced off
+        # instead of parsed again by os.path.dirname (still used for paths like '/x' or 'dir//x')
+        folder_path = file_path[:-len(file_name) - 1]
+        if not folder_path or folder_path.endswith('/'):
+            folder_path = os.path.dirname(file_path)
         if options.list_unknown_artist and not metadata.artist:
             buffers.missing_artist.append(file_path)
             buffers.folders_missing_artist.add(folder_path)
@@ -1098,11 +1474,9 @@ def process_file_multithreaded(file_path, options:ProcessingOptions, media_exten
             buffers.folders_missing_album.add(folder_path)
 
         # Normalize metadata capitalization if requested
-        exceptions = {"a", "an", "and", "as", "at", "but", "by",
-                      "for", "in", "nor", "of", "on", "or", "the", "up"}
         if options.normalize_capitalization_flag and (metadata.artist or metadata.album_artist or metadata.album):
             normalize_and_save_metadata(file_path, metadata.artist, metadata.album_artist, metadata.album,
-                                        exceptions, buffers.normalized_updates, options.verbose)
+                                        _TITLE_EXCEPTIONS, buffers.normalized_updates, options.verbose)
 
         # Insert into the album tree
         if metadata.album and metadata.artist:
@@ -1120,34 +1494,79 @@ def process_file_multithreaded(file_path, options:ProcessingOptions, media_exten
             if is_redundant:
                 buffers.redundant_albums += 1
 
-        track = Track(
-            file_path=file_path,
-            artist=metadata.artist,
-            album_artist=metadata.album_artist,
-            album=metadata.album,
-            file_size=file_size,
-            crc=crc
-        )
-        buffers.all_tracks.append(track)
+        # The per-track store is only consumed by redundant track detection,
+        # so don't hold a Track for every file in the library otherwise.
+        if options.list_redundant_tracks:
+            track = Track(
+                file_path=file_path,
+                artist=metadata.artist,
+                album_artist=metadata.album_artist,
+                album=metadata.album,
+                file_size=scan.file_size,
+                content_hash=None  # Computed in bulk by process_directory
+            )
+            buffers.all_tracks.append(track)
+
+        return scan.file_size, scan.duration if options.count_total_duration else 0.0
     else:
         buffers.various_file_count += 1
         buffers.unsupported_extensions[ext] += 1
 
 
-def process_chunk_multithreaded(files_chunk, options, media_extensions, progress_queue):
+PROGRESS_BATCH = 1024  # Files processed per progress queue message
+
+def process_chunk_multithreaded(files_chunk, options, media_extensions, progress_queue, manifest):
     """
-    Processes a chunk of files and returns a ProcessingBuffers object.
+    Processes a chunk of (file_path, file_name, ext) tuples and returns a ProcessingBuffers object.
+    manifest holds the --cache manifest entries for the files of this chunk.
     """
     buffers = ProcessingBuffers()
-    for i, file_path in enumerate(files_chunk):
-        process_file_multithreaded(file_path, options, media_extensions, buffers)
-        if i % 5 == 0:  # Update tqdm every 5 files
-            progress_queue.put(5)
+    set_normalize_cache_size(options.normalize_cache_size)  # Workers don't necessarily inherit main()'s setting
+
+    # Totals are kept in locals and stored on the buffers once the chunk is done
+    total_media_files = 0
+    total_size = 0
+    total_duration = 0.0
+    process_file = process_file_multithreaded
+    put_progress = progress_queue.put_nowait
+
+    # Deleting Windows bloat is pure I/O, so it runs on a few background threads
+    # while this worker carries on parsing tags
+    removals = []
+    with ThreadPoolExecutor(max_workers=4) as remove_executor:
+        def remove_file(file_path, counter_name):
+            removals.append((file_path, counter_name, remove_executor.submit(os.remove, file_path)))
+
+        for i, (file_path, file_name, ext) in enumerate(files_chunk, 1):
+            result = process_file(file_path, file_name, ext, options, media_extensions, buffers, remove_file, manifest)
+            if result is not None:
+                file_size, duration = result
+                total_media_files += 1
+                total_size += file_size
+                total_duration += duration
+            if i % PROGRESS_BATCH == 0:  # Report progress in batches to keep queue traffic down
+                put_progress(PROGRESS_BATCH)
+
+    for file_path, counter_name, future in removals:
+        error = future.exception()
+        if error is not None:
+            print(f"Error removing {file_path}: {error}", file=sys.stderr)
+        else:
+            setattr(buffers, counter_name, getattr(buffers, counter_name) + 1)
+
+    if len(files_chunk) % PROGRESS_BATCH:
+        put_progress(len(files_chunk) % PROGRESS_BATCH)
+
+    buffers.total_files = len(files_chunk)
+    buffers.total_media_files = total_media_files
+    buffers.total_size = total_size
+    buffers.total_duration = total_duration
+    sys.stdout.flush()  # Runs in a worker process; don't leave verbose output sitting in its buffer
     return buffers
 
 def process_directory(directory, options: ProcessingOptions):
     """
-    Process the specified directory with multithreading.
+    Process the specified directory with a pool of worker processes.
     """
 
     core_count = multiprocessing.cpu_count()
@@ -1171,20 +1590,31 @@ def process_directory(directory, options: ProcessingOptions):
 
     media_extensions = {'mp3', 'flac', 'wav', 'aac', 'ogg', 'm4a', 'wma', 'aiff', 'opus', 'alac'}
 
-    all_files = [os.path.join(root, file) for root, _, files in os.walk(directory) for file in files if
-                 not file.startswith('.')]
-    chunk_size = max(1, len(all_files) // thread_count)
+    all_files = walk_entries_parallel(directory, thread_count)
+    # Files come grouped by directory; a few chunks per worker keeps chunks spanning whole
+    # directories while still letting idle workers pick up the remaining chunks
+    chunk_size = max(256, len(all_files) // (thread_count * 4))
     file_chunks = [all_files[i:i + chunk_size] for i in range(0, len(all_files), chunk_size)]
 
-    results = []
+    # Each chunk only gets the manifest entries of its own files, so workers aren't sent the whole manifest
+    if options.manifest_cache:
+        manifest = load_manifest(options.manifest_cache)
+        chunk_manifests = [{file_path: manifest[file_path] for file_path, _, _ in chunk if file_path in manifest}
+                           for chunk in file_chunks]
+        del manifest
+    else:
+        chunk_manifests = repeat({})
 
-    progress_queue = multiprocessing.Queue()
+    # Workers are separate processes, so progress goes through a managed queue they can share
+    manager = multiprocessing.Manager()
+    progress_queue = manager.Queue()
 
     def tqdm_updater(total_files):
         # Don't display tqdm bar is using verbose mode.
         # (Constant prints break the bar)
         if options.verbose is False:
-            with tqdm(total=total_files, unit="file") as status_bar:
+            # Updates already arrive in batches of PROGRESS_BATCH files; redraw at most every 0.2s
+            with tqdm(total=total_files, unit="file", mininterval=0.2, smoothing=0) as status_bar:
                 while True:
                     progress = progress_queue.get()
                     if progress is None:
@@ -1195,53 +1625,90 @@ def process_directory(directory, options: ProcessingOptions):
                         break
                     status_bar.update(progress)
 
-    updater_thread = multiprocessing.Process(target=tqdm_updater, args=(len(all_files),))
-    updater_thread.start()
-
-    with ThreadPoolExecutor(max_workers=thread_count) as executor:
-        futures = {executor.submit(process_chunk_multithreaded, chunk, options, media_extensions, progress_queue): chunk
-                   for chunk in file_chunks}
-        for future in as_completed(futures):
-            results.append(future.result())
+    # The bar only needs to drain the queue, so a thread does instead of another process
+    updater_thread = threading.Thread(target=tqdm_updater, args=(len(all_files),))
+
+    # On local disks tag parsing is CPU bound Python, so chunks are processed in worker processes
+    # rather than threads to get around the GIL. On network shares every read waits on the network
+    # instead, and threads overlap that latency without the cost of extra processes.
+    # Flush first so forked workers don't inherit buffered output.
+    if is_network_filesystem(directory):
+        if options.verbose:
+            print("Network filesystem detected, using a thread pool")
+        executor_class = ThreadPoolExecutor
+    else:
+        executor_class = ProcessPoolExecutor
+    sys.stdout.flush()
+    with executor_class(max_workers=thread_count) as executor:
+        chunk_results = executor.map(process_chunk_multithreaded, file_chunks, repeat(options),
+                                     repeat(media_extensions), repeat(progress_queue), chunk_manifests)
+        # Started only once map() has launched the workers, so they aren't forked from a threaded process
+        updater_thread.start()
+        results = list(chunk_results)
 
     progress_queue.put(None)  # Signal tqdm to stop
     updater_thread.join()
+    manager.shutdown()
 
-    # Aggregate results
+    # Aggregate results; sum/chain/union keep the per-result loops in C
     final_buffers = ProcessingBuffers()
-    album_buffers = []
+    final_buffers.total_files = sum(buffer.total_files for buffer in results)
+    final_buffers.total_music_files = sum(buffer.total_music_files for buffer in results)
+    final_buffers.total_media_files = sum(buffer.total_media_files for buffer in results)
+    final_buffers.total_duration = sum(buffer.total_duration for buffer in results)
+    final_buffers.total_size = sum(buffer.total_size for buffer in results)
+    final_buffers.desktop_ini_removed = sum(buffer.desktop_ini_removed for buffer in results)
+    final_buffers.thumbs_db_removed = sum(buffer.thumbs_db_removed for buffer in results)
+    final_buffers.album_art_small_removed = sum(buffer.album_art_small_removed for buffer in results)
+    final_buffers.folder_jpg_removed = sum(buffer.folder_jpg_removed for buffer in results)
+    final_buffers.ehthumbs_db_removed = sum(buffer.ehthumbs_db_removed for buffer in results)
+    final_buffers.various_file_count = sum(buffer.various_file_count for buffer in results)
+    final_buffers.corrupt_file_count = sum(buffer.corrupt_file_count for buffer in results)
+
+    supported_extensions = Counter()
+    unsupported_extensions = Counter()
     for buffer in results:
-        final_buffers.total_files += buffer.total_files
-        final_buffers.total_music_files += buffer.total_music_files
-        final_buffers.total_media_files += buffer.total_media_files
-        final_buffers.total_duration += buffer.total_duration
-        final_buffers.total_size += buffer.total_size
-        final_buffers.desktop_ini_removed += buffer.desktop_ini_removed
-        final_buffers.thumbs_db_removed += buffer.thumbs_db_removed
-        final_buffers.album_art_small_removed += buffer.album_art_small_removed
-        final_buffers.folder_jpg_removed += buffer.folder_jpg_removed
-        final_buffers.various_file_count += buffer.various_file_count
-        final_buffers.corrupt_file_count += buffer.corrupt_file_count
-
-        for ext, count in buffer.supported_extensions.items():
-            final_buffers.supported_extensions[ext] += count
-        for ext, count in buffer.unsupported_extensions.items():
-            final_buffers.unsupported_extensions[ext] += count
-
-        final_buffers.missing_artist.extend(buffer.missing_artist)
-        final_buffers.missing_album_artist.extend(buffer.missing_album_artist)
-        final_buffers.missing_album.extend(buffer.missing_album)
-        final_buffers.folders_missing_artist.update(buffer.folders_missing_artist)
-        final_buffers.folders_missing_album_artist.update(buffer.folders_missing_album_artist)
-        final_buffers.folders_missing_album.update(buffer.folders_missing_album)
-        final_buffers.all_tracks.extend(buffer.all_tracks)
-        final_buffers.corrupt_files.extend(buffer.corrupt_files)
-        final_buffers.normalized_updates.extend(buffer.normalized_updates)
-
-        # Parse all albums into the final album buffer
-        album_buffers.append(buffer.album_tree)
-
-    final_buffers.album_tree = merge_album_trees(album_buffers)
+        supported_extensions.update(buffer.supported_extensions)
+        unsupported_extensions.update(buffer.unsupported_extensions)
+    final_buffers.supported_extensions = supported_extensions
+    final_buffers.unsupported_extensions = unsupported_extensions
+
+    final_buffers.missing_artist = list(chain.from_iterable(buffer.missing_artist for buffer in results))
+    final_buffers.missing_album_artist = list(chain.from_iterable(buffer.missing_album_artist for buffer in results))
+    final_buffers.missing_album = list(chain.from_iterable(buffer.missing_album for buffer in results))
+    final_buffers.all_tracks = list(chain.from_iterable(buffer.all_tracks for buffer in results))
+    final_buffers.corrupt_files = list(chain.from_iterable(buffer.corrupt_files for buffer in results))
+    final_buffers.normalized_updates = list(chain.from_iterable(buffer.normalized_updates for buffer in results))
+    final_buffers.manifest_updates = list(chain.from_iterable(buffer.manifest_updates for buffer in results))
+
+    final_buffers.folders_missing_artist = set().union(*(buffer.folders_missing_artist for buffer in results))
+    final_buffers.folders_missing_album_artist = set().union(*(buffer.folders_missing_album_artist for buffer in results))
+    final_buffers.folders_missing_album = set().union(*(buffer.folders_missing_album for buffer in results))
+
+    # Parse all albums into the final album buffer
+    final_buffers.album_tree = merge_album_trees([buffer.album_tree for buffer in results])
+    del results  # Release the per-chunk buffers; everything has been copied into final_buffers
+
+    if options.manifest_cache and final_buffers.manifest_updates:
+        save_manifest(options.manifest_cache, final_buffers.manifest_updates)
+
+    # Hashing file contents is slow, so only compute if told. Hashing runs as its own
+    # process pool pass once the library has been scanned, and only covers tracks that
+    # share their size with another track; a track with a unique size can't be a duplicate.
+    if options.list_redundant_tracks:
+        tracks_by_size = defaultdict(list)
+        for track in final_buffers.all_tracks:
+            tracks_by_size[track.file_size].append(track)
+        hash_candidates = [track for track in final_buffers.all_tracks if len(tracks_by_size[track.file_size]) > 1]
+        del tracks_by_size
+
+        # Only the candidates can end up in a redundant pair, so the rest of the Tracks are dropped here
+        final_buffers.all_tracks = hash_candidates
+
+        hash_results = compute_content_hash_batch([track.file_path for track in hash_candidates],
+                                                  show_progress=not options.verbose)
+        for track, (_, content_hash) in zip(hash_candidates, hash_results):
+            track.content_hash = content_hash
 
     # Print album statistics and final summary
     print_section_header("LIBRARY STATISTICS")
@@ -1258,15 +1725,6 @@ def process_directory(directory, options: ProcessingOptions):
         for ext, count in final_buffers.supported_extensions.items():
             print(f"{ext}: {count}")
 
-    # Define file categories
-    IMAGE_EXTENSIONS = {
-        "jpg", "jpeg", "png", "gif", "bmp", "tiff", "tif", "ico", "", "thm", "webp", "svg", "raw", "heif", "heic"
-    }
-
-    VIDEO_EXTENSIONS = {
-        "mp4", "mkv", "avi", "mov", "wmv", "flv", "webm", "m4v", "mpg", "mpeg", "ogv", "3gp", "3g2", "rm", "rmvb"
-    }
-
     # Categorize files
     image_files = {}
     video_files = {}
@@ -1307,6 +1765,7 @@ def process_directory(directory, options: ProcessingOptions):
         total_bloat_removed += final_buffers.album_art_small_removed
         total_bloat_removed += final_buffers.folder_jpg_removed
         total_bloat_removed += final_buffers.thumbs_db_removed
+        total_bloat_removed += final_buffers.ehthumbs_db_removed
 
         if total_bloat_removed > 0:
             if final_buffers.desktop_ini_removed > 0:
@@ -1320,6 +1779,9 @@ def process_directory(directory, options: ProcessingOptions):
 
             if final_buffers.thumbs_db_removed > 0:
                 print(f"Thumbs.db files removed: {final_buffers.thumbs_db_removed}")
+
+            if final_buffers.ehthumbs_db_removed > 0:
+                print(f"ehthumbs.db files removed: {final_buffers.ehthumbs_db_removed}")
         else:
             print("No Windows generated hidden files found")
 
@@ -1346,19 +1808,17 @@ def process_directory(directory, options: ProcessingOptions):
     if options.list_redundant_album:
         log_redundant_albums(final_buffers.album_tree)
     if options.list_redundant_tracks: # Log redundant tracks
-        # Build CRC map
-        crc_map, crc_collision_count = build_crc_map(final_buffers.all_tracks)
-        redundant_tracks, duplicates_count = find_redundant_tracks(crc_map)
+        hash_collision_count = count_hash_collisions(final_buffers.all_tracks)
+        redundant_tracks, duplicates_count = find_redundant_tracks(final_buffers.all_tracks)
         log_redundant_tracks(redundant_tracks)
         if duplicates_count > 0:
             print(f"Total redundant track pairs found: {duplicates_count}")
-        if crc_collision_count > 0:
-            print(f"Total CRC collisions detected: {crc_collision_count}")
+        if hash_collision_count > 0:
+            print(f"Total content hash collisions detected: {hash_collision_count}")
 
     # Handle interactive metadata fixing
     if options.fix_missing_album_artist or options.fix_missing_album or options.fix_missing_artist:
-        exceptions = {"a", "an", "and", "as", "at", "but", "by",
-                      "for", "in", "nor", "of", "on", "or", "the", "up"}
+        exceptions = _TITLE_EXCEPTIONS
 
         if options.fix_missing_album_artist and final_buffers.folders_missing_album_artist:
             prompt_fix_metadata(
@@ -1382,20 +1842,23 @@ def process_directory(directory, options: ProcessingOptions):
                 media_extensions=media_extensions)
 
 class Tee:
-    def __init__(self, filename, mode="w"):
-        self.file = open(filename, mode)
-        self.stdout = sys.stdout  # Save original stdout
-
-    def write(self, message):
-        self.stdout.write(message)  # Print to console
-        self.file.write(message)  # Write to file
-
-    def flush(self):
-        self.stdout.flush()
-        self.file.flush()
+    """
+    Copies everything written to stdout into a file by pointing file descriptor 1 at a tee(1) subprocess.
+    Python writes each buffer once, with no per-write duplication in Python, and worker processes
+    (which inherit fd 1) are logged as well.
+    """
+    def __init__(self, filename):
+        sys.stdout.flush()
+        self.process = subprocess.Popen(["tee", "--", filename], stdin=subprocess.PIPE)
+        self.saved_stdout = os.dup(1)  # Save original stdout
+        os.dup2(self.process.stdin.fileno(), 1)
+        self.process.stdin.close()  # fd 1 is now the only write end of the pipe
 
     def close(self):
-        self.file.close()
+        sys.stdout.flush()
+        os.dup2(self.saved_stdout, 1)  # Restore original stdout, which closes the pipe so tee exits
+        os.close(self.saved_stdout)
+        self.process.wait()
 
 
 def is_valid_filename(filename):
@@ -1438,7 +1901,7 @@ def main():
                         help="Lists all albums in directory based on metadata tags.")
     parser.add_argument("--remove-windows-hidden-files", action="store_true",
                         help="Removes files automatically generated by Windows. "
-                             "(Desktop.ini, Thumbs.db, AlbumArtSmall.jpg, Folder.jpg) "
+                             "(Desktop.ini, Thumbs.db, ehthumbs.db, AlbumArtSmall.jpg, Folder.jpg) "
                              "This is safe to run for Mac and Linux users. It won't break anything "
                              "on Windows, but the OS will automatically regenerate these files.")
     parser.add_argument("--fix-missing-album-artist-by-folder", action="store_true",
@@ -1451,6 +1914,12 @@ def main():
                         help="Tallies up the duration of all audio files, and sums them. (slow)")
     parser.add_argument("--num-threads", type=int,
                         help="Specify number of thread to run script on. Defaults to max. (Min: 1, Max: Cores * 2)")
+    parser.add_argument("--cache", nargs="?", const=DEFAULT_MANIFEST_PATH, default=None, metavar="PATH",
+                        help="Remember the tags of scanned files in a sqlite manifest and skip re-parsing files whose "
+                             f"size and modification time haven't changed since. (Default path: {DEFAULT_MANIFEST_PATH})")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_NORMALIZE_CACHE_SIZE,
+                        help="Number of normalized artist/album strings to memoize per worker when normalizing "
+                             f"capitalization. 0 disables the cache. (Default: {DEFAULT_NORMALIZE_CACHE_SIZE})")
     args = parser.parse_args()
 
     # Validate the directory
@@ -1461,8 +1930,11 @@ def main():
     tee = None
     if args.log_output:
         if is_valid_filename(args.log_output):
-            tee = Tee(args.log_output)
-            sys.stdout = tee  # Redirect stdout to tee
+            try:
+                tee = Tee(args.log_output)
+            except OSError as e:
+                print(f"Error: could not start tee for '{args.log_output}': {e}", file=sys.stderr)
+                sys.exit(1)
         else:
             print(f"Error: '{args.log_output}' is not a valid Linux filename.", file=sys.stderr)
             sys.exit(1)
@@ -1487,16 +1959,19 @@ def main():
         list_all_albums=args.list_all_albums,
         remove_windows_hidden_files=args.remove_windows_hidden_files,
         count_total_duration=args.count_total_duration,
-        threads=thread_count
+        threads=thread_count,
+        normalize_cache_size=max(0, args.cache_size),
+        manifest_cache=args.cache
     )
+    set_normalize_cache_size(options.normalize_cache_size)
 
     process_directory(
         directory=args.directory,
         options=options
     )
+    _normalize_capitalization_cached.cache_clear()  # Don't hold on to the memo once the run is done
 
     if tee:
-        sys.stdout = tee.stdout  # Restore original stdout
         tee.close()
 
 if __name__ == "__main__":
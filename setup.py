@@ -7,10 +7,13 @@ setup(
     description="A tool for organizing large music libraries and splitting .cue files",
     packages=["music_stats"],
     install_requires=[
-        "ffmpeg-python",
         "mutagen",
         "tqdm"
     ],
+    extras_require={
+        # Faster content hashing for --list-redundant-tracks and faster --cache manifest encoding
+        "fast": ["isal", "xxhash", "orjson"],
+    },
     entry_points={
         "console_scripts": [
             "cue-splitter=music_stats.cue_splitter:main",
@@ -22,5 +25,5 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: POSIX :: Linux",
     ],
-    python_requires='>=3.7',
+    python_requires='>=3.10',
 )
@@ -0,0 +1,57 @@
+import os
+import struct
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "music_stats"))
+
+from fast_tags import read_tags  # noqa: E402
+from music_stats import scan_file  # noqa: E402
+
+
+def _flac_block(block_type, body, last=False):
+    return bytes([block_type | (0x80 if last else 0)]) + len(body).to_bytes(3, "big") + body
+
+
+def _make_flac(comments, sample_rate=44100, total_samples=44100 * 3):
+    """Build a minimal FLAC file: STREAMINFO, a Vorbis comment with the given entries, and no audio frames."""
+    streaminfo = bytearray(34)
+    streaminfo[10] = (sample_rate >> 12) & 0xFF
+    streaminfo[11] = (sample_rate >> 4) & 0xFF
+    streaminfo[12] = ((sample_rate & 0x0F) << 4) | (1 << 1)  # Stereo
+    streaminfo[13] = (15 << 4) | ((total_samples >> 32) & 0x0F)  # 16 bits per sample
+    streaminfo[14:18] = (total_samples & 0xFFFFFFFF).to_bytes(4, "big")
+    vendor = b"test"
+    vorbis_comment = struct.pack("<I", len(vendor)) + vendor + struct.pack("<I", len(comments))
+    for comment in comments:
+        vorbis_comment += struct.pack("<I", len(comment)) + comment
+    return b"fLaC" + _flac_block(0, bytes(streaminfo)) + _flac_block(4, vorbis_comment, last=True)
+
+
+class TitleOnlyFlacTest(unittest.TestCase):
+    """A FLAC tagged with fields music_stats doesn't read still has tags, so it keeps its duration."""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".flac")
+        with os.fdopen(handle, "wb") as f:
+            f.write(_make_flac([b"TITLE=Only a title"]))
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_read_tags_reports_tagged(self):
+        with open(self.path, "rb") as f:
+            tags, length, tagged = read_tags(f, "flac")
+        self.assertEqual(tags, {})
+        self.assertEqual(length, 3.0)
+        self.assertTrue(tagged)
+
+    def test_scan_file_keeps_duration(self):
+        scan = scan_file(self.path, ext="flac")
+        self.assertEqual(scan.duration, 3.0)
+        self.assertFalse(scan.metadata.corrupt)
+
+
+if __name__ == "__main__":
+    unittest.main()